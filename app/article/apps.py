@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class ArticleConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'app.article'
+
+    def ready(self):
+        from app.article import signals  # noqa: F401
+        from app.article.filters import install_tag_filter_index
+        from app.article.search import install_search_index
+
+        post_migrate.connect(install_search_index, sender=self)
+        post_migrate.connect(install_tag_filter_index, sender=self)
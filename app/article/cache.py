@@ -0,0 +1,92 @@
+import hashlib
+import time
+from urllib.parse import urlencode, urlsplit, urlunsplit
+
+from django.conf import settings
+from django.core.cache import cache
+
+FEED_GENERATION_KEY = 'public_feed:generation'
+# Pagination links of a cached page, stored relative to the host
+PAGE_LINKS = ('next', 'previous')
+
+
+def _reset_feed_generation():
+    # Seeded from the clock so an evicted counter never comes back to a generation that was already used
+    cache.add(FEED_GENERATION_KEY, time.time_ns(), None)
+    return cache.get(FEED_GENERATION_KEY)
+
+
+def _get_feed_generation():
+    generation = cache.get(FEED_GENERATION_KEY)
+    if generation is None:
+        generation = _reset_feed_generation()
+    return generation
+
+
+def get_feed_list_key(query_params):
+    """Cache key of one public feed page, scoped to the current feed generation"""
+
+    query = urlencode(sorted(query_params.lists()), doseq=True)
+    digest = hashlib.md5(query.encode('utf-8')).hexdigest()
+    return f'public_feed:list:{_get_feed_generation()}:{digest}'
+
+
+def get_cacheable_page(data):
+    """Copy of a paginated response body with host-relative links, the cached page is shared by every host"""
+
+    data = dict(data)
+    for link in PAGE_LINKS:
+        if data.get(link):
+            parts = urlsplit(data[link])
+            data[link] = urlunsplit(('', '', parts.path, parts.query, parts.fragment))
+    return data
+
+
+def get_page_for_request(data, request):
+    """Cached page with its links made absolute for the host of `request`"""
+
+    data = dict(data)
+    for link in PAGE_LINKS:
+        if data.get(link):
+            data[link] = request.build_absolute_uri(data[link])
+    return data
+
+
+def get_feed_detail_key(post_id):
+    return f'public_feed:detail:{post_id}'
+
+
+def get_cached(key):
+    return cache.get(key)
+
+
+def set_cached(key, data):
+    cache.set(key, data, settings.PUBLIC_FEED_CACHE_TIMEOUT)
+
+
+def get_cached_detail(post_id, variant):
+    """Cached representation of a post, `variant` tells apart e.g. different expansions"""
+
+    return (cache.get(get_feed_detail_key(post_id)) or {}).get(variant)
+
+
+def set_cached_detail(post_id, variant, data):
+    # All variants share one entry so invalidating a post is a single delete
+    key = get_feed_detail_key(post_id)
+    variants = cache.get(key) or {}
+    variants[variant] = data
+    cache.set(key, variants, settings.PUBLIC_FEED_CACHE_TIMEOUT)
+
+
+def invalidate_feed(post_ids=()):
+    """Drop the cached detail of the given posts and every cached feed page"""
+
+    post_ids = list(post_ids)
+    if post_ids:
+        cache.delete_many([get_feed_detail_key(post_id) for post_id in post_ids])
+
+    # Bumping the generation orphans every list key at once, old entries expire on their own
+    try:
+        cache.incr(FEED_GENERATION_KEY)
+    except ValueError:
+        _reset_feed_generation()
@@ -0,0 +1,87 @@
+from django.db.models import Case, Count, F, IntegerField, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce
+
+from app.article.models import BlogPost
+
+
+def adjust_like_count(post_id, delta):
+    """Apply a like delta to the denormalized counter, call inside the transaction writing the Like"""
+
+    BlogPost.objects.filter(pk=post_id).update(like_count=F('like_count') + delta)
+
+
+def adjust_like_counts(deltas):
+    """Apply many like deltas, `deltas` maps post id -> delta, in one UPDATE"""
+
+    deltas = {post_id: delta for post_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    BlogPost.objects.filter(pk__in=deltas).update(
+        like_count=F('like_count') + Case(
+            *[When(pk=post_id, then=Value(delta)) for post_id, delta in deltas.items()],
+            output_field=IntegerField()
+        )
+    )
+
+
+def set_current_counters(items):
+    """
+        Overwrite the counters of already serialized posts with the stored values, for payloads cached between
+        counter writes (cached feed pages). One IN query on the primary key for the whole page.
+    """
+
+    items = [item for item in items if 'pk' in item and ('like_count' in item or 'comment_count' in item)]
+    if not items:
+        return
+
+    counters = {
+        post_id: (like_count, comment_count)
+        for post_id, like_count, comment_count in BlogPost.objects.filter(pk__in=[item['pk'] for item in items])
+        .values_list('pk', 'like_count', 'comment_count')
+    }
+
+    for item in items:
+        if item['pk'] not in counters:
+            continue
+        like_count, comment_count = counters[item['pk']]
+        if 'like_count' in item:
+            item['like_count'] = like_count
+        if 'comment_count' in item:
+            item['comment_count'] = comment_count
+
+
+def adjust_comment_count(post_id, delta):
+    """Apply a comment delta to the denormalized counter, call inside the transaction writing the Comment"""
+
+    BlogPost.objects.filter(pk=post_id).update(comment_count=F('comment_count') + delta)
+
+
+def _active_count_subquery(model):
+    """Correlated COUNT of the active rows of `model` pointing at the outer post"""
+
+    return Coalesce(
+        Subquery(
+            model.active_objects.filter(blog_post=OuterRef('pk'))
+            .order_by()
+            .values('blog_post')
+            .annotate(total=Count('pk'))
+            .values('total')
+        ),
+        Value(0)
+    )
+
+
+def rebuild_counters(queryset=None):
+    """Recompute like_count and comment_count from the like and comment tables"""
+
+    from app.comment.models import Comment
+    from app.like.models import Like
+
+    if queryset is None:
+        queryset = BlogPost.objects.all()
+
+    return queryset.update(
+        like_count=_active_count_subquery(Like),
+        comment_count=_active_count_subquery(Comment),
+    )
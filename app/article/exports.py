@@ -0,0 +1,53 @@
+import csv
+import json
+
+# Columns of an exported post, also the input format of the import_posts command
+EXPORT_FIELDS = ('id', 'title', 'content', 'excerpt', 'status', 'category', 'tags', 'created', 'modified')
+# Tags are exported by name, joined with this separator in CSV
+TAG_SEPARATOR = '|'
+
+
+class ExportFormat:
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+    choices = (NDJSON, CSV)
+    content_types = {NDJSON: 'application/x-ndjson', CSV: 'text/csv'}
+
+
+def get_export_row(post):
+    """Portable representation of a post: category and tags by name so another instance can import it"""
+
+    return {
+        'id': post.pk,
+        'title': post.title,
+        'content': post.content,
+        'excerpt': post.excerpt or '',
+        'status': post.status,
+        'category': post.category.name if post.category_id else None,
+        'tags': [tag.name for tag in post.tags.all()],
+        'created': post.created.isoformat(),
+        'modified': post.modified.isoformat(),
+    }
+
+
+class _Echo:
+    """File-like object handing back what csv.writer writes, so each row can be yielded"""
+
+    def write(self, value):
+        return value
+
+
+def stream_ndjson(posts):
+    for post in posts:
+        yield json.dumps(get_export_row(post), ensure_ascii=False) + '\n'
+
+
+def stream_csv(posts):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+
+    for post in posts:
+        row = get_export_row(post)
+        row['tags'] = TAG_SEPARATOR.join(row['tags'])
+        yield writer.writerow([row[field] if row[field] is not None else '' for field in EXPORT_FIELDS])
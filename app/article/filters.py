@@ -0,0 +1,64 @@
+from django.db import connections
+from django.db.models import Count, Exists, OuterRef
+
+TAG_FILTER_INDEX = 'article_blogpost_tags_tag_post_idx'
+
+
+class TagFilterMode:
+    ANY = 'any'
+    ALL = 'all'
+
+    choices = (ANY, ALL)
+
+
+def install_tag_filter_index(using='default', **kwargs):
+    """
+        (tag_id, blogpost_id) index on the auto-created tags through table, which can't declare Meta indexes.
+        It lets both tag filters run as index-only scans.
+    """
+
+    from app.article.models import BlogPost
+
+    table = BlogPost.tags.through._meta.db_table
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(f'CREATE INDEX IF NOT EXISTS {TAG_FILTER_INDEX} ON {table} (tag_id, blogpost_id)')
+
+
+def get_tag_ids(values):
+    """Distinct integer tag ids from query parameter values, anything else is ignored"""
+
+    # isdecimal, not isdigit: int() rejects digits such as '²'
+    return list(dict.fromkeys(int(value) for value in values if value.isdecimal()))
+
+
+def get_tag_mode(query_params):
+    """tags_mode of a request, ANY by default and None when it isn't one of TagFilterMode.choices"""
+
+    mode = query_params.get('tags_mode', TagFilterMode.ANY)
+    return mode if mode in TagFilterMode.choices else None
+
+
+def filter_by_tags(queryset, tag_ids, mode=TagFilterMode.ANY):
+    """
+        Posts carrying any (EXISTS) or all (grouped subquery) of the tags.
+        Neither joins the through table into the outer query, so no DISTINCT is needed.
+    """
+
+    from app.article.models import BlogPost
+
+    if not tag_ids:
+        return queryset
+
+    through_queryset = BlogPost.tags.through.objects.filter(tag_id__in=tag_ids)
+
+    if mode == TagFilterMode.ALL:
+        return queryset.filter(
+            pk__in=through_queryset.order_by()
+            .values('blogpost_id')
+            .annotate(matched=Count('tag_id'))
+            .filter(matched=len(tag_ids))
+            .values('blogpost_id')
+        )
+
+    return queryset.filter(Exists(through_queryset.filter(blogpost_id=OuterRef('pk'))))
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.article.cache import invalidate_feed
+from app.article.models import BlogPost
+from app.article.search import refresh_search_documents
+from app.article.text import TEXT_FIELDS, derive_text_fields
+
+
+class Command(BaseCommand):
+    help = "Derive the excerpt, word count and reading time of existing blog posts from their content"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def backfill(self, post_ids):
+        posts = list(BlogPost.objects.filter(pk__in=post_ids).only('pk', 'content', *TEXT_FIELDS))
+        for post in posts:
+            derive_text_fields(post)
+
+        # bulk_update leaves `modified` alone, the posts didn't change for their authors
+        with transaction.atomic():
+            BlogPost.objects.bulk_update(posts, TEXT_FIELDS)
+            refresh_search_documents(post_ids)
+        return len(posts)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        post_ids = BlogPost.objects.order_by('pk').values_list('pk', flat=True)
+        batch = []
+        total = 0
+
+        for post_id in post_ids.iterator(chunk_size=batch_size):
+            batch.append(post_id)
+            if len(batch) == batch_size:
+                total += self.backfill(batch)
+                batch = []
+
+        if batch:
+            total += self.backfill(batch)
+
+        # Generated excerpts change cached feed pages
+        invalidate_feed()
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled text fields for {total} posts"))
@@ -0,0 +1,290 @@
+import csv
+import io
+import json
+import os
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models, transaction
+from django.db.models.functions import Upper
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from app.article.cache import invalidate_feed
+from app.article.exports import TAG_SEPARATOR
+from app.article.models import BlogPost
+from app.article.related import rebuild_related_posts
+from app.article.search import refresh_search_documents
+from app.article.text import derive_text_fields
+from app.category.models import Category
+from app.tag.models import Tag
+
+
+def read_jsonl(file, skip):
+    for line_number, line in enumerate(file, start=1):
+        if line_number <= skip or not line.strip():
+            continue
+        yield line_number, json.loads(line)
+
+
+def read_csv(file, skip):
+    for line_number, row in enumerate(csv.DictReader(file), start=1):
+        if line_number <= skip:
+            continue
+        row['tags'] = row.get('tags', '').split(TAG_SEPARATOR) if row.get('tags') else []
+        yield line_number, row
+
+
+def _get_copy_text(value):
+    """A value in COPY's text format"""
+
+    if value is None:
+        return '\\N'
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+def copy_rows(cursor, table, columns, rows):
+    """Load rows with COPY FROM STDIN, on psycopg2 or psycopg 3"""
+
+    sql = 'COPY {} ({}) FROM STDIN'.format(
+        connection.ops.quote_name(table),
+        ', '.join(connection.ops.quote_name(column) for column in columns)
+    )
+    data = ''.join('\t'.join(_get_copy_text(value) for value in row) + '\n' for row in rows)
+
+    if hasattr(cursor.cursor, 'copy_expert'):
+        cursor.cursor.copy_expert(sql, io.StringIO(data))
+    else:
+        with cursor.cursor.copy(sql) as copy:
+            copy.write(data)
+
+
+class NameLookup:
+    """
+        Case insensitive name to id cache of a Tag or Category model, creating the names it doesn't know.
+        Names are unique regardless of is_active, so a soft deleted row matching a name is reactivated.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.ids = {}
+        self.reactivated = []
+
+    def resolve(self, names):
+        missing = {}
+        for name in names:
+            # The first spelling of a new name is the one created, normalized like the create serializers
+            if name and name.strip() and name.strip().upper() not in self.ids:
+                missing.setdefault(name.strip().upper(), name.strip().capitalize())
+        if not missing:
+            return
+
+        inactive_ids = []
+        for upper_name, pk, is_active in self.model.objects.annotate(upper_name=Upper('name')) \
+                .filter(upper_name__in=missing).values_list('upper_name', 'pk', 'is_active'):
+            self.ids[upper_name] = pk
+            if not is_active:
+                inactive_ids.append(pk)
+
+        # Saved one by one so the signals refresh the search documents and feed of the posts already carrying them
+        for row in self.model.objects.filter(pk__in=inactive_ids):
+            row.is_active = True
+            row.save(update_fields=['is_active', 'modified'])
+            self.reactivated.append(row.name)
+
+        new_names = [name for key, name in missing.items() if key not in self.ids]
+        if new_names:
+            # A concurrent insert of the same name wins, its id is read back below
+            self.model.objects.bulk_create(
+                [self.model(name=name) for name in new_names], ignore_conflicts=True
+            )
+            self.ids.update(
+                self.model.objects.annotate(upper_name=Upper('name'))
+                .filter(upper_name__in=[name.upper() for name in new_names])
+                .values_list('upper_name', 'pk')
+            )
+
+    def get(self, name):
+        return self.ids.get(name.strip().upper()) if name and name.strip() else None
+
+
+class Command(BaseCommand):
+    help = "Import blog posts, with their categories and tags by name, from a JSONL or CSV export"
+
+    formats = {'jsonl': read_jsonl, 'ndjson': read_jsonl, 'csv': read_csv}
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--user', required=True, help="Email of the author of the imported posts")
+        parser.add_argument('--format', choices=sorted(self.formats), help="Defaults to the file extension")
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--checkpoint', help="Progress file, defaults to <path>.checkpoint")
+        parser.add_argument('--restart', action='store_true', help="Ignore the checkpoint and import from the start")
+        parser.add_argument('--skip-related', action='store_true', help="Don't rebuild related posts at the end")
+
+    def get_reader(self, options):
+        file_format = options['format'] or os.path.splitext(options['path'])[1].lstrip('.').lower()
+        if file_format not in self.formats:
+            raise CommandError(f"Unknown format '{file_format}', pass --format")
+        return self.formats[file_format]
+
+    def get_post(self, row, user_id, now):
+        title = (row.get('title') or '').strip()
+        if not title or not row.get('content'):
+            raise ValueError("title and content are required")
+
+        status = row.get('status') or BlogPost.StatusChoice.DRAFT
+        if status not in BlogPost.StatusChoice.values:
+            raise ValueError(f"unknown status '{status}'")
+
+        post = BlogPost(
+            user_id=user_id,
+            category_id=self.categories.get(row.get('category')),
+            title=title[:BlogPost._meta.get_field('title').max_length],
+            content=row['content'],
+            excerpt=row.get('excerpt') or None,
+            status=status,
+        )
+        post.created = self.get_datetime(row.get('created')) or now
+        post.modified = self.get_datetime(row.get('modified')) or post.created
+        derive_text_fields(post)
+        return post
+
+    def get_datetime(self, value):
+        value = parse_datetime(value) if value else None
+        if value is not None and timezone.is_aware(value):
+            value = timezone.make_naive(value)
+        return value
+
+    def insert_with_copy(self, posts):
+        """Reserve ids from the sequence, then COPY the posts and their through rows"""
+
+        fields = BlogPost._meta.concrete_fields
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)',
+                [BlogPost._meta.db_table, BlogPost._meta.pk.column, len(posts)]
+            )
+            for post, (pk,) in zip(posts, cursor.fetchall()):
+                post.pk = pk
+
+            rows = []
+            for post in posts:
+                row = []
+                for field in fields:
+                    # Timestamps come from the file, every other value as Django would save it
+                    value = getattr(post, field.attname) if field.name in ('created', 'modified') \
+                        else field.get_prep_value(field.pre_save(post, add=True))
+                    if isinstance(field, models.JSONField) and value is not None:
+                        value = json.dumps(value)
+                    row.append(value)
+                rows.append(row)
+            copy_rows(cursor, BlogPost._meta.db_table, [field.column for field in fields], rows)
+
+            through_model = BlogPost.tags.through
+            copy_rows(cursor, through_model._meta.db_table, ['blogpost_id', 'tag_id'], [
+                (post.pk, tag_id) for post in posts for tag_id in post.import_tag_ids
+            ])
+
+    def insert_with_bulk_create(self, posts):
+        timestamps = [(post.created, post.modified) for post in posts]
+        BlogPost.objects.bulk_create(posts)
+
+        # auto_now fields are overwritten by bulk_create, bulk_update puts the imported ones back
+        for post, (created, modified) in zip(posts, timestamps):
+            post.created, post.modified = created, modified
+        BlogPost.objects.bulk_update(posts, ['created', 'modified'])
+
+        through_model = BlogPost.tags.through
+        through_model.objects.bulk_create([
+            through_model(blogpost_id=post.pk, tag_id=tag_id) for post in posts for tag_id in post.import_tag_ids
+        ])
+
+    def import_batch(self, rows, user_id):
+        self.categories.resolve(row.get('category') for _, row in rows)
+        self.tags.resolve(name for _, row in rows for name in row.get('tags') or ())
+
+        now = timezone.now()
+        posts = []
+        for line_number, row in rows:
+            try:
+                post = self.get_post(row, user_id, now)
+            except ValueError as error:
+                self.stderr.write(f"Row {line_number} skipped: {error}")
+                continue
+            post.import_tag_ids = list(dict.fromkeys(
+                tag_id for tag_id in map(self.tags.get, row.get('tags') or ()) if tag_id is not None
+            ))
+            posts.append(post)
+
+        if not posts:
+            return 0
+
+        # The whole batch lands or nothing does, so the checkpoint never points past missing rows
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                self.insert_with_copy(posts)
+            else:
+                self.insert_with_bulk_create(posts)
+            refresh_search_documents([post.pk for post in posts])
+        return len(posts)
+
+    def write_checkpoint(self, path, line_number):
+        with open(path, 'w') as file:
+            json.dump({'line': line_number}, file)
+
+    def handle(self, *args, **options):
+        path = options['path']
+        batch_size = options['batch_size']
+        checkpoint_path = options['checkpoint'] or f'{path}.checkpoint'
+        reader = self.get_reader(options)
+
+        user_id = get_user_model().active_objects.filter(email=options['user']) \
+            .values_list('pk', flat=True).first()
+        if user_id is None:
+            raise CommandError(f"No active user with email '{options['user']}'")
+
+        skip = 0
+        if not options['restart'] and os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as file:
+                skip = json.load(file)['line']
+            self.stdout.write(f"Resuming after row {skip}")
+
+        self.categories = NameLookup(Category)
+        self.tags = NameLookup(Tag)
+
+        total = 0
+        started = time.monotonic()
+        batch = []
+
+        with open(path, newline='', encoding='utf-8') as file:
+            for line_number, row in reader(file, skip):
+                batch.append((line_number, row))
+                if len(batch) < batch_size:
+                    continue
+
+                total += self.import_batch(batch, user_id)
+                self.write_checkpoint(checkpoint_path, line_number)
+                batch = []
+
+                elapsed = time.monotonic() - started
+                self.stdout.write(f"Row {line_number}: {total} posts imported ({total / elapsed:.0f}/s)")
+
+            if batch:
+                total += self.import_batch(batch, user_id)
+                self.write_checkpoint(checkpoint_path, batch[-1][0])
+
+        for label, lookup in (('categories', self.categories), ('tags', self.tags)):
+            if lookup.reactivated:
+                self.stdout.write(f"Reactivated soft deleted {label}: {', '.join(lookup.reactivated)}")
+
+        invalidate_feed()
+        if not options['skip_related']:
+            rebuild_related_posts()
+
+        # A finished import starts over next time
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        self.stdout.write(self.style.SUCCESS(f"Imported {total} posts in {time.monotonic() - started:.1f}s"))
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from app.article.related import apply_related_refreshes
+
+
+class Command(BaseCommand):
+    help = "Recompute the related posts of the posts queued by tag, category and publication changes"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--follow', action='store_true', help="Keep polling the queue instead of exiting once empty")
+        parser.add_argument('--interval', type=float, default=5.0, help="Seconds between polls of an empty queue")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        total = 0
+
+        while True:
+            refreshed = apply_related_refreshes(batch_size)
+            total += refreshed
+
+            if refreshed:
+                self.stdout.write(f"Refreshed related posts of {refreshed} queued posts")
+            elif options['follow']:
+                time.sleep(options['interval'])
+            else:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f"Refreshed related posts of {total} queued posts"))
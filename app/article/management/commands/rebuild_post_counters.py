@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.article.counters import rebuild_counters
+from app.article.models import BlogPost
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized like and comment counters of every blog post"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        post_ids = BlogPost.objects.order_by('pk').values_list('pk', flat=True)
+        batch = []
+        total = 0
+
+        # One short transaction per batch keeps row locks on hot posts brief
+        for post_id in post_ids.iterator(chunk_size=batch_size):
+            batch.append(post_id)
+            if len(batch) == batch_size:
+                with transaction.atomic():
+                    total += rebuild_counters(BlogPost.objects.filter(pk__in=batch))
+                batch = []
+
+        if batch:
+            with transaction.atomic():
+                total += rebuild_counters(BlogPost.objects.filter(pk__in=batch))
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt counters for {total} posts"))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from app.article.related import rebuild_related_posts
+
+
+class Command(BaseCommand):
+    help = "Recompute the related posts of every published post from shared tags and category"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        total = rebuild_related_posts(batch_size=options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt related posts for {total} posts"))
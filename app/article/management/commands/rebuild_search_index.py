@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from app.article.models import BlogPost
+from app.article.search import install_search_index, refresh_search_documents
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search document of every blog post"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        install_search_index()
+
+        post_ids = BlogPost.objects.order_by('pk').values_list('pk', flat=True)
+        batch = []
+        total = 0
+
+        for post_id in post_ids.iterator(chunk_size=batch_size):
+            batch.append(post_id)
+            if len(batch) == batch_size:
+                refresh_search_documents(batch)
+                total += len(batch)
+                batch = []
+
+        refresh_search_documents(batch)
+        total += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt search documents for {total} posts"))
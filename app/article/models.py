@@ -1,8 +1,12 @@
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 from app.category.models import Category
+from app.core.models import ActiveManager, ActiveQuerySet
+from app.core.uploads import content_addressed_storage
 from app.tag.models import Tag
 
 
@@ -41,16 +45,104 @@ class BlogPost(models.Model):
     title = models.CharField(max_length=255)
     content = models.TextField()
     excerpt = models.TextField(blank=True, null=True)
-    image = models.ImageField(upload_to='blog_images/', blank=True, null=True)
+    image = models.ImageField(upload_to='blog_images/', storage=content_addressed_storage, blank=True, null=True)
+    # Urls of the resized copies of `image`, built off-request by app.core.images
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
 
     status = models.CharField(max_length=10, choices=StatusChoice, default=StatusChoice.DRAFT.value)
     is_featured = models.BooleanField(default=False)
     view_count = models.PositiveIntegerField(default=0)
 
+    # Derived from content on save (app.article.text), the excerpt only when the author left it empty
+    is_excerpt_generated = models.BooleanField(default=False, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveIntegerField(default=0, editable=False)
+
+    # Denormalized counters, maintained in the same transaction as the like/comment write
+    like_count = models.PositiveIntegerField(default=0, editable=False)
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
+
+    # Search document (PostgreSQL only, SQLite keeps it in an FTS5 table)
+    search_vector = SearchVectorField(null=True, editable=False)
+
     # Additional field declarations
     is_active = models.BooleanField(default=True)
     created = models.DateTimeField(auto_now_add=True)
     modified = models.DateTimeField(auto_now=True)
 
+    # Every row, soft deleted ones included; `active_objects` for live rows
+    objects = ActiveQuerySet.as_manager()
+    active_objects = ActiveManager()
+
     class Meta:
         ordering = ['-modified']
+        indexes = [
+            # Author listing: BlogListFilterAPIView, keyset pages on (-modified, -id)
+            models.Index(fields=['user', '-modified', '-id'], name='blogpost_user_modified_idx',
+                         condition=Q(is_active=True)),
+            # Public feed and status filters
+            models.Index(fields=['status', '-modified', '-id'], name='blogpost_status_modified_idx',
+                         condition=Q(is_active=True)),
+            models.Index(fields=['category', '-modified'], name='blogpost_category_idx',
+                         condition=Q(is_active=True)),
+            models.Index(fields=['-modified'], name='blogpost_featured_idx',
+                         condition=Q(is_active=True, is_featured=True)),
+        ]
+
+
+class RelatedPost(models.Model):
+    """Precomputed top-N neighbours of a published post by shared tags and category (app.article.related)"""
+
+    # Covered by the (post, rank) constraint, which also serves the endpoint's ordered read
+    post = models.ForeignKey(
+        BlogPost,
+        on_delete=models.CASCADE,
+        db_index=False,
+        related_name='related_entries',
+        related_query_name='related_entry'
+    )
+    related = models.ForeignKey(
+        BlogPost,
+        on_delete=models.CASCADE,
+        related_name='related_to_entries',
+        related_query_name='related_to_entry'
+    )
+
+    score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'rank'], name='relatedpost_post_rank_uniq'),
+        ]
+
+
+class RelatedRefresh(models.Model):
+    """Post whose related posts are stale, recomputed in batches by the process_related_refreshes command"""
+
+    post = models.OneToOneField(BlogPost, on_delete=models.CASCADE, primary_key=True, related_name='+')
+    created = models.DateTimeField(auto_now_add=True)
+
+
+class TrendingScore(models.Model):
+    """
+        Time-decayed activity score of a post (app.article.trending).
+        Stored as log(sum of weight * 2^(age from a fixed epoch / half life)) so events never need rescaling,
+        ordering by log_score is ordering by the current decayed score.
+    """
+
+    post = models.OneToOneField(
+        BlogPost,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='trending_score',
+        related_query_name='trending_score'
+    )
+
+    log_score = models.FloatField()
+    modified = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-log_score'], name='trendingscore_score_idx'),
+        ]
@@ -0,0 +1,222 @@
+import heapq
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+
+# Bonus added to the tag Jaccard similarity when two posts share their category
+CATEGORY_WEIGHT = 0.25
+# Most recent posts of the same category considered as candidates, on top of the tag neighbours
+CATEGORY_CANDIDATES = 200
+# Tags on more posts than this still count in the similarity but don't generate candidates,
+# otherwise a handful of very common tags would make the job quadratic
+MAX_TAG_CANDIDATES = 2000
+
+
+def _get_public_posts():
+    from app.article.models import BlogPost
+
+    return BlogPost.active_objects.filter(status=BlogPost.StatusChoice.PUBLISHED)
+
+
+class RelatedGraph:
+    """Tag sets and categories of a set of public posts, with tag and category inverted indexes"""
+
+    def __init__(self, posts, post_tags, common_tag_ids=()):
+        # Tags known to be over MAX_TAG_CANDIDATES when the graph only holds part of their posts
+        self.common_tag_ids = set(common_tag_ids)
+        self.categories = {}
+        self.tag_sets = defaultdict(set)
+        self.tag_index = defaultdict(list)
+        self.category_index = defaultdict(list)
+
+        # `posts` is ordered by recency so category candidates are the most recent ones
+        for post_id, category_id in posts:
+            self.categories[post_id] = category_id
+            if category_id is not None:
+                self.category_index[category_id].append(post_id)
+
+        for post_id, tag_id in post_tags:
+            if post_id in self.categories:
+                self.tag_sets[post_id].add(tag_id)
+                self.tag_index[tag_id].append(post_id)
+
+    @classmethod
+    def from_queryset(cls, queryset, common_tag_ids=()):
+        from app.article.models import BlogPost
+
+        posts = queryset.order_by('-modified', '-id').values_list('pk', 'category_id')
+        post_tags = BlogPost.tags.through.objects.filter(
+            blogpost_id__in=queryset.values('pk'),
+            tag__is_active=True
+        ).values_list('blogpost_id', 'tag_id')
+        return cls(list(posts), post_tags, common_tag_ids)
+
+    def get_candidates(self, post_id):
+        candidates = set()
+        for tag_id in self.tag_sets.get(post_id, ()):
+            if tag_id not in self.common_tag_ids and len(self.tag_index[tag_id]) <= MAX_TAG_CANDIDATES:
+                candidates.update(self.tag_index[tag_id])
+
+        category_id = self.categories[post_id]
+        if category_id is not None:
+            candidates.update(self.category_index[category_id][:CATEGORY_CANDIDATES])
+
+        candidates.discard(post_id)
+        return candidates
+
+    def get_neighbours(self, post_id, limit):
+        """Top `limit` (score, post id) by tag Jaccard similarity plus the category bonus"""
+
+        tags = self.tag_sets.get(post_id, set())
+        category_id = self.categories[post_id]
+
+        scored = []
+        for candidate_id in self.get_candidates(post_id):
+            candidate_tags = self.tag_sets.get(candidate_id, set())
+            shared = len(tags & candidate_tags)
+            union = len(tags) + len(candidate_tags) - shared
+
+            score = shared / union if union else 0.0
+            if category_id is not None and self.categories.get(candidate_id) == category_id:
+                score += CATEGORY_WEIGHT
+            if score > 0:
+                scored.append((score, candidate_id))
+
+        return heapq.nlargest(limit, scored)
+
+
+def load_graph(post_ids):
+    """Graph holding the given public posts and every post that can be one of their neighbours"""
+
+    from app.article.models import BlogPost
+
+    through_model = BlogPost.tags.through
+    public_posts = _get_public_posts()
+    source_posts = dict(public_posts.filter(pk__in=post_ids).values_list('pk', 'category_id'))
+
+    # Tags over the cap don't generate candidates, so their posts are never loaded
+    tag_post_counts = through_model.objects.filter(
+        tag_id__in=through_model.objects.filter(blogpost_id__in=source_posts, tag__is_active=True).values('tag_id'),
+        blogpost_id__in=public_posts.values('pk')
+    ).values('tag_id').annotate(post_count=Count('blogpost_id')).values_list('tag_id', 'post_count')
+    common_tag_ids = set()
+    candidate_tag_ids = []
+    for tag_id, post_count in tag_post_counts:
+        if post_count > MAX_TAG_CANDIDATES:
+            common_tag_ids.add(tag_id)
+        else:
+            candidate_tag_ids.append(tag_id)
+
+    candidate_ids = set(source_posts)
+    if candidate_tag_ids:
+        candidate_ids.update(
+            through_model.objects.filter(
+                tag_id__in=candidate_tag_ids,
+                blogpost_id__in=public_posts.values('pk')
+            ).values_list('blogpost_id', flat=True)
+        )
+    for category_id in set(source_posts.values()) - {None}:
+        candidate_ids.update(
+            public_posts.filter(category_id=category_id).order_by('-modified', '-id')
+            .values_list('pk', flat=True)[:CATEGORY_CANDIDATES]
+        )
+
+    graph = RelatedGraph.from_queryset(public_posts.filter(pk__in=candidate_ids), common_tag_ids)
+    return graph, set(source_posts)
+
+
+def get_related_rows(graph, post_ids, limit=None):
+    from app.article.models import RelatedPost
+
+    limit = limit or settings.RELATED_POSTS_LIMIT
+    return [
+        RelatedPost(post_id=post_id, related_id=related_id, score=score, rank=rank)
+        for post_id in post_ids
+        for rank, (score, related_id) in enumerate(graph.get_neighbours(post_id, limit), start=1)
+    ]
+
+
+def write_related_rows(post_ids, rows):
+    """Replace the neighbours of `post_ids` with `rows`"""
+
+    from app.article.models import RelatedPost
+
+    with transaction.atomic():
+        RelatedPost.objects.filter(post_id__in=post_ids).delete()
+        RelatedPost.objects.bulk_create(rows)
+
+
+def refresh_related_posts(post_ids):
+    """
+        Incremental update after posts changed (tags, category, publication).
+        Recomputes the changed posts, the posts currently listing them and their new neighbours;
+        posts that are no longer public lose their own list.
+    """
+
+    from app.article.models import RelatedPost
+
+    post_ids = set(post_ids)
+    if not post_ids:
+        return
+
+    referencing_ids = set(RelatedPost.objects.filter(related_id__in=post_ids).values_list('post_id', flat=True))
+
+    graph, public_ids = load_graph(post_ids)
+    rows = get_related_rows(graph, public_ids)
+    neighbour_ids = {row.related_id for row in rows} | referencing_ids
+    neighbour_ids -= post_ids
+
+    if neighbour_ids:
+        neighbour_graph, public_neighbour_ids = load_graph(neighbour_ids)
+        rows += get_related_rows(neighbour_graph, public_neighbour_ids)
+
+    write_related_rows(post_ids | neighbour_ids, rows)
+
+
+def queue_related_refresh(post_ids):
+    """Mark posts for the next process_related_refreshes run, a post already waiting is queued once"""
+
+    from app.article.models import RelatedRefresh
+
+    RelatedRefresh.objects.bulk_create(
+        [RelatedRefresh(post_id=post_id) for post_id in set(post_ids)], ignore_conflicts=True
+    )
+
+
+def apply_related_refreshes(batch_size):
+    """Refresh the related posts of the oldest `batch_size` queued posts, returns how many were consumed"""
+
+    from app.article.models import RelatedRefresh
+
+    with transaction.atomic():
+        # Concurrent workers take disjoint batches on PostgreSQL
+        post_ids = list(
+            RelatedRefresh.objects.select_for_update(skip_locked=True).order_by('created')
+            .values_list('post_id', flat=True)[:batch_size]
+        )
+        if not post_ids:
+            return 0
+
+        refresh_related_posts(post_ids)
+        RelatedRefresh.objects.filter(post_id__in=post_ids).delete()
+
+    return len(post_ids)
+
+
+def rebuild_related_posts(batch_size=1000):
+    """Recompute the neighbours of every public post from one in-memory graph, returns the post count"""
+
+    from app.article.models import RelatedPost
+
+    public_posts = _get_public_posts()
+    graph = RelatedGraph.from_queryset(public_posts)
+    post_ids = list(graph.categories)
+
+    for start in range(0, len(post_ids), batch_size):
+        batch = post_ids[start:start + batch_size]
+        write_related_rows(batch, get_related_rows(graph, batch))
+
+    RelatedPost.objects.exclude(post_id__in=public_posts.values('pk')).delete()
+    return len(post_ids)
@@ -0,0 +1,134 @@
+import threading
+from collections import OrderedDict
+from html import escape
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+import markdown
+from django.conf import settings
+
+ALLOWED_TAGS = {
+    'a', 'abbr', 'b', 'blockquote', 'br', 'code', 'del', 'em', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr',
+    'i', 'img', 'li', 'ol', 'p', 'pre', 's', 'strong', 'sub', 'sup', 'table', 'tbody', 'td', 'th', 'thead',
+    'tr', 'ul',
+}
+ALLOWED_ATTRIBUTES = {
+    'a': {'href', 'title'},
+    'abbr': {'title'},
+    'code': {'class'},
+    'img': {'src', 'alt', 'title'},
+    'td': {'align'},
+    'th': {'align'},
+}
+URL_ATTRIBUTES = {'href', 'src'}
+ALLOWED_URL_SCHEMES = {'', 'http', 'https', 'mailto'}
+VOID_TAGS = {'br', 'hr', 'img'}
+# Dropped together with everything inside them
+DROPPED_CONTENT_TAGS = {'script', 'style', 'iframe', 'object', 'embed', 'template', 'noscript'}
+
+
+class HTMLSanitizer(HTMLParser):
+    """Rebuild HTML keeping only allowlisted tags and attributes, everything else is escaped or dropped"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.output = []
+        self.open_tags = []
+        self.dropped_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in DROPPED_CONTENT_TAGS:
+            self.dropped_depth += 1
+            return
+        if self.dropped_depth or tag not in ALLOWED_TAGS:
+            return
+
+        allowed_attributes = ALLOWED_ATTRIBUTES.get(tag, set())
+        rendered_attributes = ''
+        for name, value in attrs:
+            if name not in allowed_attributes or value is None:
+                continue
+            if name in URL_ATTRIBUTES and urlsplit(value.strip()).scheme.lower() not in ALLOWED_URL_SCHEMES:
+                continue
+            rendered_attributes += f' {name}="{escape(value)}"'
+
+        if tag == 'a':
+            rendered_attributes += ' rel="nofollow noopener"'
+
+        self.output.append(f'<{tag}{rendered_attributes}>')
+        if tag not in VOID_TAGS:
+            self.open_tags.append(tag)
+
+    def handle_endtag(self, tag):
+        if tag in DROPPED_CONTENT_TAGS:
+            self.dropped_depth = max(self.dropped_depth - 1, 0)
+            return
+        if self.dropped_depth or tag not in self.open_tags:
+            return
+
+        # Close anything left open inside this tag so the output stays well formed
+        while self.open_tags:
+            open_tag = self.open_tags.pop()
+            self.output.append(f'</{open_tag}>')
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if not self.dropped_depth:
+            self.output.append(escape(data, quote=False))
+
+    def get_html(self):
+        self.close()
+        return ''.join(self.output) + ''.join(f'</{tag}>' for tag in reversed(self.open_tags))
+
+
+def sanitize_html(html):
+    sanitizer = HTMLSanitizer()
+    sanitizer.feed(html)
+    return sanitizer.get_html()
+
+
+def render_content(content):
+    """Markdown to sanitized HTML"""
+
+    return sanitize_html(markdown.markdown(content or '', extensions=['extra']))
+
+
+class RenderedContentCache:
+    """
+        In-process LRU of rendered post bodies, one entry per post holding the rendering of one `modified`.
+        A newer `modified` replaces the entry, the least recently used post is evicted past `max_entries`.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, post_id, modified, content):
+        """Rendered HTML of this version of the post, rendering it on a miss"""
+
+        with self._lock:
+            entry = self._entries.get(post_id)
+            if entry is not None and entry[0] == modified:
+                self._entries.move_to_end(post_id)
+                return entry[1]
+
+        # Rendered outside the lock, two readers racing on a miss render the same version twice
+        html = render_content(content)
+
+        with self._lock:
+            self._entries[post_id] = (modified, html)
+            self._entries.move_to_end(post_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        return html
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+rendered_content_cache = RenderedContentCache(max_entries=settings.RENDERED_CONTENT_CACHE_SIZE)
@@ -0,0 +1,128 @@
+import logging
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connection, connections
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.expressions import RawSQL
+
+logger = logging.getLogger('django')
+
+SEARCH_CONFIG = 'english'
+SQLITE_FTS_TABLE = 'article_blogpost_fts'
+
+
+def install_search_index(using='default', **kwargs):
+    """Create the backend specific search index (GIN on PostgreSQL, FTS5 table on SQLite)"""
+
+    from app.article.models import BlogPost
+
+    db_connection = connections[using]
+    table = BlogPost._meta.db_table
+
+    with db_connection.cursor() as cursor:
+        if db_connection.vendor == 'postgresql':
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {table}_search_gin ON {table} USING gin (search_vector)'
+            )
+        elif db_connection.vendor == 'sqlite':
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} "
+                f"USING fts5(title, excerpt, content, tags, tokenize='porter unicode61')"
+            )
+
+
+def _get_tag_names(post_ids):
+    """Map post id -> space separated names of its active tags"""
+
+    from app.article.models import BlogPost
+
+    tag_names = {post_id: [] for post_id in post_ids}
+    through_queryset = BlogPost.tags.through.objects.filter(
+        blogpost_id__in=post_ids,
+        tag__is_active=True
+    ).values_list('blogpost_id', 'tag__name')
+
+    for post_id, name in through_queryset:
+        tag_names[post_id].append(name)
+
+    return {post_id: ' '.join(names) for post_id, names in tag_names.items()}
+
+
+def refresh_search_documents(post_ids):
+    """Rebuild the search document of the given posts from title, excerpt, content and tag names"""
+
+    from app.article.models import BlogPost
+
+    post_ids = list(post_ids)
+    if not post_ids:
+        return
+
+    if connection.vendor == 'postgresql':
+        # One UPDATE for the whole batch, tag names aggregated in a correlated subquery
+        tag_names = Subquery(
+            BlogPost.tags.through.objects.filter(blogpost_id=OuterRef('pk'), tag__is_active=True)
+            .order_by()
+            .values('blogpost_id')
+            .annotate(names=StringAgg('tag__name', delimiter=' '))
+            .values('names')
+        )
+        BlogPost.objects.filter(pk__in=post_ids).update(
+            search_vector=(
+                SearchVector('title', weight='A', config=SEARCH_CONFIG)
+                + SearchVector(tag_names, weight='B', config=SEARCH_CONFIG)
+                + SearchVector('excerpt', weight='B', config=SEARCH_CONFIG)
+                + SearchVector('content', weight='C', config=SEARCH_CONFIG)
+            )
+        )
+
+    elif connection.vendor == 'sqlite':
+        tag_names = _get_tag_names(post_ids)
+        posts = BlogPost.objects.filter(pk__in=post_ids).values_list('pk', 'title', 'excerpt', 'content')
+        placeholders = ', '.join(['%s'] * len(post_ids))
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid IN ({placeholders})', post_ids)
+            cursor.executemany(
+                f'INSERT INTO {SQLITE_FTS_TABLE} (rowid, title, excerpt, content, tags) VALUES (%s, %s, %s, %s, %s)',
+                [(pk, title, excerpt or '', content, tag_names[pk]) for pk, title, excerpt, content in posts]
+            )
+
+
+def _get_fts_match_query(search):
+    """Quote every term so user input can never be parsed as FTS5 query syntax"""
+
+    terms = search.split()
+    return ' '.join('"%s"' % term.replace('"', '""') for term in terms)
+
+
+def search_posts(queryset, search):
+    """Filter a BlogPost queryset by a search string and order it by relevance"""
+
+    search = search.strip()
+    if not search:
+        return queryset
+
+    if connection.vendor == 'postgresql':
+        query = SearchQuery(search, search_type='websearch', config=SEARCH_CONFIG)
+        return queryset.filter(search_vector=query).annotate(
+            search_rank=SearchRank(F('search_vector'), query)
+        ).order_by('-search_rank', '-modified')
+
+    if connection.vendor == 'sqlite':
+        match_query = _get_fts_match_query(search)
+        table = queryset.model._meta.db_table
+        return queryset.filter(
+            pk__in=RawSQL(f'SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s', (match_query,))
+        ).annotate(
+            search_rank=RawSQL(
+                f'SELECT -bm25({SQLITE_FTS_TABLE}, 10.0, 5.0, 1.0, 5.0) FROM {SQLITE_FTS_TABLE} '
+                f'WHERE {SQLITE_FTS_TABLE} MATCH %s AND rowid = "{table}"."id"',
+                (match_query,)
+            )
+        ).order_by('-search_rank', '-modified')
+
+    logger.warning(f"Full-text search is not supported on {connection.vendor}, falling back to icontains")
+    return queryset.filter(
+        Q(title__icontains=search) | Q(excerpt__icontains=search) | Q(content__icontains=search)
+    )
@@ -1,8 +1,14 @@
+from django.conf import settings
 from rest_framework import serializers
 
 from app.article.models import BlogPost
+from app.article.rendering import rendered_content_cache
 from app.category.models import Category
+from app.category.serializers import CategoryListFilterDisplaySerializer
+from app.core.serializers import ExpandableFieldsMixin, SparseFieldsMixin
 from app.tag.models import Tag
+from app.tag.serializers import TagDisplaySerializer
+from app.user.serializers import UserAuthorDisplaySerializer
 
 
 class BlogPostCreateSerializer(serializers.ModelSerializer):
@@ -22,7 +28,7 @@ class BlogPostCreateSerializer(serializers.ModelSerializer):
 
     def validate_category(self, value):
         """Validate that category exists and is active"""
-        if value and not Category.objects.filter(pk=value.pk, is_active=True).exists():
+        if value and not Category.active_objects.filter(pk=value.pk).exists():
             raise serializers.ValidationError("Invalid category")
         return value
 
@@ -30,34 +36,119 @@ class BlogPostCreateSerializer(serializers.ModelSerializer):
         """Validate that all tags exist and are active"""
         if value:
             tag_ids = [tag.pk for tag in value]
-            existing_tags = Tag.objects.filter(pk__in=tag_ids, is_active=True)
+            existing_tags = Tag.active_objects.filter(pk__in=tag_ids)
             if existing_tags.count() != len(tag_ids):
                 raise serializers.ValidationError("One or more tags are invalid")
         return value
 
 
-class BlogPostDisplaySerializer(serializers.ModelSerializer):
+class BlogPostDisplaySerializer(SparseFieldsMixin, ExpandableFieldsMixin, serializers.ModelSerializer):
+    expandable_fields = {
+        'category': (CategoryListFilterDisplaySerializer, {}),
+        'tags': (TagDisplaySerializer, {'many': True}),
+        'user': (UserAuthorDisplaySerializer, {}),
+    }
+
+    rendered_content = serializers.SerializerMethodField()
+    liked_by_me = serializers.SerializerMethodField()
+
     class Meta:
         model = BlogPost
         fields = ('pk',
                   'title',
                   'content',
+                  'rendered_content',
                   'excerpt',
                   'image',
+                  'image_variants',
                   'category',
                   'tags',
                   'status',
-                  'user',)
-class BlogPostListFilterDisplaySerializer(serializers.ModelSerializer):
+                  'user',
+                  'word_count',
+                  'reading_time',
+                  'like_count',
+                  'liked_by_me',
+                  'comment_count',)
+
+    def get_rendered_content(self, obj):
+        """Sanitized HTML of the content, rendered once per post version"""
+
+        if not settings.RENDER_CONTENT:
+            return None
+        return rendered_content_cache.get(obj.pk, obj.modified, obj.content)
+
+    def get_liked_by_me(self, obj):
+        # Annotated by the authenticated views, shared (cached) payloads are filled per request
+        return getattr(obj, 'liked_by_me', False)
+
+
+class BlogPostListFilterDisplaySerializer(SparseFieldsMixin, ExpandableFieldsMixin, serializers.ModelSerializer):
+    """List representation: the stored excerpt stands in for the content, which is never loaded"""
+
+    expandable_fields = {
+        'category': (CategoryListFilterDisplaySerializer, {}),
+        'tags': (TagDisplaySerializer, {'many': True}),
+        'user': (UserAuthorDisplaySerializer, {}),
+    }
+
+    liked_by_me = serializers.SerializerMethodField()
+
     class Meta:
         model = BlogPost
         fields = ('pk',
                   'title',
                   'excerpt',
                   'image',
+                  'image_variants',
                   'category',
                   'tags',
-                  'status',)
+                  'status',
+                  'user',
+                  'word_count',
+                  'reading_time',
+                  'like_count',
+                  'liked_by_me',
+                  'comment_count',)
+
+    def get_liked_by_me(self, obj):
+        return getattr(obj, 'liked_by_me', False)
+
+
+class BlogPostBulkItemSerializer(serializers.ModelSerializer):
+    """
+        One item of a bulk create/update.
+        Category and tag ids are checked against the id sets preloaded for the whole batch
+        (context['category_ids'] / context['tag_ids']), so validating an item runs no query.
+    """
+
+    pk = serializers.IntegerField(required=False)
+    category = serializers.IntegerField(required=False, allow_null=True)
+    tags = serializers.ListField(child=serializers.IntegerField(), required=False)
+
+    class Meta:
+        model = BlogPost
+        fields = (
+            'pk',
+            'title',
+            'content',
+            'excerpt',
+            'category',
+            'tags',
+            'status',
+        )
+
+    def validate_category(self, value):
+        """Validate that category exists and is active"""
+        if value is not None and value not in self.context['category_ids']:
+            raise serializers.ValidationError("Invalid category")
+        return value
+
+    def validate_tags(self, value):
+        """Validate that all tags exist and are active"""
+        if any(tag_id not in self.context['tag_ids'] for tag_id in value):
+            raise serializers.ValidationError("One or more tags are invalid")
+        return list(dict.fromkeys(value))
 
 
 class BlogPostUpdateSerializer(serializers.ModelSerializer):
@@ -78,6 +169,10 @@ class BlogPostUpdateSerializer(serializers.ModelSerializer):
 
         tags_data = validated_data.pop('tags', None)
 
+        # An excerpt sent by the author replaces the generated one, an empty one is generated again
+        if 'excerpt' in validated_data:
+            instance.is_excerpt_generated = False
+
         instance = super().update(instance, validated_data)
 
         # Handle tags replacement (only if tags are provided in the request)
@@ -85,4 +180,6 @@ class BlogPostUpdateSerializer(serializers.ModelSerializer):
             # This will replace all existing tags with the new ones
             instance.tags.set(tags_data)
 
+        return instance
+
 
@@ -0,0 +1,141 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from app.article.cache import invalidate_feed
+from app.article.models import BlogPost
+from app.article.related import queue_related_refresh
+from app.article.search import refresh_search_documents
+from app.article.text import TEXT_FIELDS, derive_text_fields
+from app.category.models import Category
+from app.core.images import reset_stale_variants, schedule_image_variants
+from app.tag.models import Tag
+
+
+def _is_public(instance):
+    """Whether a post is visible on the public feed, None when the fields were deferred"""
+
+    values = instance.__dict__
+    if 'status' not in values or 'is_active' not in values:
+        return None
+    return values['is_active'] and values['status'] == BlogPost.StatusChoice.PUBLISHED
+
+
+def _schedule_related_refresh(post_ids):
+    # Queued with the write itself, process_related_refreshes recomputes them outside the request
+    post_ids = list(post_ids)
+    if post_ids:
+        queue_related_refresh(post_ids)
+
+
+def _schedule_feed_invalidation(post_ids):
+    # Readers keep seeing the committed row until then, invalidating earlier lets them re-cache the old version
+    post_ids = list(post_ids)
+    transaction.on_commit(lambda: invalidate_feed(post_ids))
+
+
+def _published_post_ids(queryset):
+    return list(
+        queryset.active().filter(status=BlogPost.StatusChoice.PUBLISHED).values_list('pk', flat=True)
+    )
+
+
+@receiver(post_init, sender=BlogPost)
+def blog_post_loaded(sender, instance, **kwargs):
+    """Remember whether the post was public so saves of drafts don't invalidate the feed"""
+
+    instance._was_public = _is_public(instance)
+    instance._original_category_id = instance.__dict__.get('category_id')
+
+
+def _image_variants_built(post_id):
+    invalidate_feed([post_id])
+
+
+@receiver(pre_save, sender=BlogPost)
+def blog_post_saving(sender, instance, **kwargs):
+    """Derive the text columns from the content, skipped when any of them is deferred"""
+
+    if all(field in instance.__dict__ for field in ('content', *TEXT_FIELDS)):
+        derive_text_fields(instance)
+    reset_stale_variants(instance, 'image', 'image_variants')
+
+
+@receiver(post_save, sender=BlogPost)
+def blog_post_saved(sender, instance, **kwargs):
+    """Keep the search document in sync with the post columns"""
+
+    refresh_search_documents([instance.pk])
+    # No timestamp: `modified` orders the feeds, a background resize mustn't move the post
+    schedule_image_variants(instance, 'image', 'image_variants', on_update=_image_variants_built)
+
+    is_public = _is_public(instance)
+    if instance._was_public is not False or is_public is not False:
+        _schedule_feed_invalidation([instance.pk])
+
+    # Related posts only depend on publication, category and tags
+    category_id = instance.__dict__.get('category_id')
+    if instance._was_public != is_public or (is_public and category_id != instance._original_category_id):
+        _schedule_related_refresh([instance.pk])
+
+    instance._was_public = is_public
+    instance._original_category_id = category_id
+
+
+@receiver(m2m_changed, sender=BlogPost.tags.through)
+def blog_post_tags_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep the search document and the public feed in sync with the tags of a post"""
+
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            refresh_search_documents([instance.pk])
+            if _is_public(instance) is not False:
+                _schedule_feed_invalidation([instance.pk])
+                _schedule_related_refresh([instance.pk])
+        return
+
+    # Tag side: the posts are in pk_set, except for clear where they must be captured beforehand
+    if action == 'pre_clear':
+        instance._cleared_blog_post_ids = list(instance.tagged_blog_posts.values_list('pk', flat=True))
+        return
+
+    if action == 'post_clear':
+        post_ids = getattr(instance, '_cleared_blog_post_ids', [])
+    elif action in ('post_add', 'post_remove'):
+        post_ids = list(pk_set)
+    else:
+        return
+
+    refresh_search_documents(post_ids)
+
+    published_post_ids = _published_post_ids(BlogPost.objects.filter(pk__in=post_ids))
+    if published_post_ids:
+        _schedule_feed_invalidation(published_post_ids)
+        _schedule_related_refresh(published_post_ids)
+
+
+@receiver(post_save, sender=Tag)
+def tag_saved(sender, instance, created, **kwargs):
+    """A renamed or deactivated tag changes the search document and feed entry of every post carrying it"""
+
+    if created:
+        return
+
+    post_ids = instance.tagged_blog_posts.values_list('pk', flat=True)
+    refresh_search_documents(post_ids)
+
+    published_post_ids = _published_post_ids(instance.tagged_blog_posts.all())
+    if published_post_ids:
+        _schedule_feed_invalidation(published_post_ids)
+
+
+@receiver(post_save, sender=Category)
+def category_saved(sender, instance, created, **kwargs):
+    """A renamed or deactivated category changes the feed entry of every post in it"""
+
+    if created:
+        return
+
+    published_post_ids = _published_post_ids(instance.category_blog_posts.all())
+    if published_post_ids:
+        _schedule_feed_invalidation(published_post_ids)
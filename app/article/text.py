@@ -0,0 +1,57 @@
+import math
+import re
+from html import unescape
+
+from django.utils.html import strip_tags
+
+from app.article.rendering import render_content
+
+EXCERPT_LENGTH = 280
+WORDS_PER_MINUTE = 200
+
+WORD_PATTERN = re.compile(r'\w+(?:[\'’-]\w+)*')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Columns written by derive_text_fields
+TEXT_FIELDS = ('excerpt', 'is_excerpt_generated', 'word_count', 'reading_time')
+
+
+def get_plain_text(content):
+    """
+        Content without markup and with collapsed whitespace.
+        Taken from the rendered, sanitized HTML so Markdown syntax and script/style bodies don't reach the excerpt.
+    """
+
+    return WHITESPACE_PATTERN.sub(' ', unescape(strip_tags(render_content(content)))).strip()
+
+
+def make_excerpt(text, length=EXCERPT_LENGTH):
+    """Cut plain text at the last word boundary before `length` characters"""
+
+    if len(text) <= length:
+        return text
+
+    excerpt = text[:length + 1].rsplit(' ', 1)[0] if ' ' in text[:length] else text[:length]
+    return excerpt.rstrip(' .,;:-') + '…'
+
+
+def get_reading_time(word_count):
+    """Reading time in whole minutes, at least one minute for any non-empty post"""
+
+    return math.ceil(word_count / WORDS_PER_MINUTE)
+
+
+def derive_text_fields(post):
+    """
+        Set word_count, reading_time and, unless the author wrote one, the excerpt from the content.
+        Called on every save and by the bulk paths that skip signals.
+    """
+
+    text = get_plain_text(post.content)
+
+    post.word_count = len(WORD_PATTERN.findall(text))
+    post.reading_time = get_reading_time(post.word_count)
+
+    if post.is_excerpt_generated or not post.excerpt:
+        post.excerpt = make_excerpt(text)
+        post.is_excerpt_generated = True
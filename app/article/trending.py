@@ -0,0 +1,75 @@
+import math
+from datetime import datetime
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, FloatField, Value, When
+from django.db.models.functions import Abs, Exp, Greatest, Least, Ln
+from django.utils import timezone
+
+# Scores grow from this instant instead of decaying towards it, so stored scores never need rewriting
+TRENDING_EPOCH = datetime(2025, 1, 1)
+
+LIKE_WEIGHT = 5.0
+VIEW_WEIGHT = 1.0
+
+# log_score of a row without events (a score of ~0)
+EMPTY_LOG_SCORE = -1e6
+
+
+def _get_decay_rate():
+    """Growth rate per second, the weight of an event doubles every half life after the epoch"""
+
+    return math.log(2) / (settings.TRENDING_HALF_LIFE_HOURS * 3600)
+
+
+def _get_log_weight(weight, now):
+    return math.log(weight) + _get_decay_rate() * (now - TRENDING_EPOCH).total_seconds()
+
+
+def get_current_score(log_score, now=None):
+    """Decayed score as of `now`, comparable across posts and over time"""
+
+    now = now or timezone.now()
+    return math.exp(log_score - _get_decay_rate() * (now - TRENDING_EPOCH).total_seconds())
+
+
+def _log_add_exp(a, b):
+    """
+        log(exp(a) + exp(b)) without overflow: max(a, b) + log(1 + exp(-|a - b|)).
+        The gap is capped since exp underflows to an error on PostgreSQL and adds nothing past ~50.
+    """
+
+    return Greatest(a, b) + Ln(Value(1.0) + Exp(-Least(Abs(a - b), Value(50.0))))
+
+
+def bump_trending(weights):
+    """
+        Add events to the trending score of posts, `weights` maps post id -> summed event weight.
+        Missing rows are created empty first, then one UPDATE folds every event in atomically.
+    """
+
+    from app.article.models import TrendingScore
+
+    weights = {post_id: weight for post_id, weight in weights.items() if weight > 0}
+    if not weights:
+        return
+
+    now = timezone.now()
+
+    with transaction.atomic():
+        TrendingScore.objects.bulk_create(
+            [TrendingScore(post_id=post_id, log_score=EMPTY_LOG_SCORE, modified=now) for post_id in weights],
+            ignore_conflicts=True
+        )
+        TrendingScore.objects.filter(post_id__in=weights).update(
+            log_score=_log_add_exp(
+                F('log_score'),
+                Case(
+                    *[When(post_id=post_id, then=Value(_get_log_weight(weight, now)))
+                      for post_id, weight in weights.items()],
+                    output_field=FloatField()
+                )
+            ),
+            modified=now
+        )
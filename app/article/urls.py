@@ -1,11 +1,21 @@
 from django.urls import path
 
-from app.article.views import BlogCreateAPIView, BlogDetailAPIView, BlogListFilterAPIView
+from app.article.views import BlogCreateAPIView, BlogDetailAPIView, BlogListFilterAPIView, PublicBlogListAPIView, \
+    PublicBlogDetailAPIView, BlogBulkAPIView, BlogExportAPIView, PublicRelatedBlogListAPIView, \
+    PublicTrendingBlogListAPIView
 
 urlpatterns = [
 
     path("", BlogCreateAPIView.as_view(), name="blog-create"),
     path('<int:pk>', BlogDetailAPIView.as_view(), name='blog-detail'),
     path('list-filter/', BlogListFilterAPIView.as_view(), name='blog-list-filter'),
+    path('bulk/', BlogBulkAPIView.as_view(), name='blog-bulk'),
+    path('export/', BlogExportAPIView.as_view(), name='blog-export'),
+
+    # Public feed
+    path('public/', PublicBlogListAPIView.as_view(), name='blog-public-list'),
+    path('public/trending/', PublicTrendingBlogListAPIView.as_view(), name='blog-public-trending'),
+    path('public/<int:pk>', PublicBlogDetailAPIView.as_view(), name='blog-public-detail'),
+    path('public/<int:pk>/related/', PublicRelatedBlogListAPIView.as_view(), name='blog-public-related'),
 
 ]
@@ -0,0 +1,113 @@
+import atexit
+import logging
+import threading
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, F, PositiveIntegerField, Value, When
+
+from app.article.trending import VIEW_WEIGHT, bump_trending
+
+logger = logging.getLogger('django')
+
+
+class ViewCountBuffer:
+    """
+        Write-behind buffer for BlogPost.view_count.
+        Views are counted in memory and flushed as one batched UPDATE, either periodically,
+        when the number of buffered posts reaches `max_posts`, or when the worker exits.
+    """
+
+    def __init__(self, flush_interval, max_posts):
+        self.flush_interval = flush_interval
+        self.max_posts = max_posts
+
+        self._counts = Counter()
+        self._lock = threading.Lock()
+        self._flusher = None
+        self._stopped = threading.Event()
+
+    def record(self, post_id, views=1):
+        """Buffer `views` views of a post, flushing inline if the buffer is full"""
+
+        self._ensure_flusher()
+
+        with self._lock:
+            self._counts[post_id] += views
+            is_full = len(self._counts) >= self.max_posts
+
+        if is_full:
+            self.flush()
+
+    def flush(self):
+        """Write every buffered view with a single UPDATE ... SET view_count = view_count + n"""
+
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+
+        if not counts:
+            return 0
+
+        from app.article.models import BlogPost
+
+        try:
+            BlogPost.objects.filter(pk__in=counts.keys()).update(
+                view_count=F('view_count') + Case(
+                    *[When(pk=post_id, then=Value(views)) for post_id, views in counts.items()],
+                    default=Value(0),
+                    output_field=PositiveIntegerField()
+                )
+            )
+        except Exception:
+            logger.error("Failed to flush buffered view counts", exc_info=True)
+            self._restore(counts)
+            return 0
+
+        # Views are already counted, a failure here only loses their trending weight
+        try:
+            bump_trending({post_id: views * VIEW_WEIGHT for post_id, views in counts.items()})
+        except Exception:
+            logger.error("Failed to add buffered views to trending scores", exc_info=True)
+
+        return len(counts)
+
+    def _restore(self, counts):
+        """Put unflushed views back, dropping them rather than growing past the bound"""
+
+        with self._lock:
+            for post_id, views in counts.items():
+                if post_id in self._counts or len(self._counts) < self.max_posts:
+                    self._counts[post_id] += views
+
+    def _ensure_flusher(self):
+        """Start the periodic flush thread on first use so commands and migrations never spawn it"""
+
+        if self._flusher is not None:
+            return
+
+        with self._lock:
+            if self._flusher is not None:
+                return
+
+            self._flusher = threading.Thread(target=self._run, name='view-count-flusher', daemon=True)
+            self._flusher.start()
+            atexit.register(self.stop)
+
+    def _run(self):
+        while not self._stopped.wait(self.flush_interval):
+            self.flush()
+            # The flusher owns its own connection, release it between flushes
+            connection.close()
+
+    def stop(self):
+        """Stop the flush thread and write whatever is still buffered"""
+
+        self._stopped.set()
+        self.flush()
+
+
+view_count_buffer = ViewCountBuffer(
+    flush_interval=settings.VIEW_COUNT_FLUSH_INTERVAL,
+    max_posts=settings.VIEW_COUNT_BUFFER_SIZE,
+)
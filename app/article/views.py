@@ -1,24 +1,114 @@
+import json
 import logging
 import uuid
 
 from django.conf import settings
 from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
-from rest_framework import status
+from rest_framework import serializers, status
+from rest_framework.fields import ChoiceField
 from rest_framework.generics import GenericAPIView, ListAPIView
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
-from app.article.models import BlogPost
-from app.article.serializers import BlogPostCreateSerializer, BlogPostDisplaySerializer, BlogPostUpdateSerializer
+from app.article.cache import get_cached, get_cached_detail, get_cacheable_page, get_feed_list_key, \
+    get_page_for_request, set_cached, set_cached_detail, invalidate_feed
+from app.article.counters import set_current_counters
+from app.article.exports import ExportFormat, stream_csv, stream_ndjson
+from app.article.filters import TagFilterMode, filter_by_tags, get_tag_ids, get_tag_mode
+from app.article.models import BlogPost, RelatedPost, TrendingScore
+from app.article.related import queue_related_refresh
+from app.article.search import refresh_search_documents, search_posts
+from app.article.serializers import BlogPostCreateSerializer, BlogPostDisplaySerializer, BlogPostUpdateSerializer, \
+    BlogPostBulkItemSerializer, BlogPostListFilterDisplaySerializer
+from app.article.text import TEXT_FIELDS, derive_text_fields
+from app.article.trending import get_current_score
+from app.article.view_buffer import view_count_buffer
 from app.category.models import Category
-from app.core.views import CustomPageNumberPagination
+from app.like.queries import annotate_liked_by_me, set_liked_by_me
+from app.tag.models import Tag
+from app.core.authentication import OptionalJWTAuthentication
+from app.core.views import CustomPageNumberPagination, CursorPaginationMixin, ExpandMixin, SparseFieldsMixin, \
+    cursor_pagination_parameters
 from app.global_constants import SuccessMessage, ErrorMessage
-from app.utils import get_response_schema
+from app.utils import get_response_schema, get_record_validators, get_not_modified_response, set_validator_headers
 from permissions import IsUser
 
 logger = logging.getLogger('django')
 
+expand_parameter = openapi.Parameter(
+    'expand', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+    description='Comma separated relations to nest: category, tags, user'
+)
+
+tags_mode_parameter = openapi.Parameter(
+    'tags_mode', openapi.IN_QUERY, type=openapi.TYPE_STRING, enum=list(TagFilterMode.choices),
+    description='Match posts having any (default) or all of the given tags'
+)
+
+fields_parameter = openapi.Parameter(
+    'fields', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+    description='Comma separated fields to return, e.g. pk,title,excerpt (content is not loaded unless listed)'
+)
+
+# Serializer field -> BlogPost column loaded for it, tags come from the prefetch
+blog_post_sparse_fields = {
+    'pk': 'id',
+    'title': 'title',
+    'content': 'content',
+    'rendered_content': ('content', 'modified'),
+    'excerpt': 'excerpt',
+    'image': 'image',
+    'image_variants': 'image_variants',
+    'category': 'category',
+    'tags': None,
+    'status': 'status',
+    'user': 'user',
+    'word_count': 'word_count',
+    'reading_time': 'reading_time',
+    'like_count': 'like_count',
+    'liked_by_me': (),
+    'comment_count': 'comment_count',
+}
+
+# List endpoints serve the stored excerpt and never load content
+blog_post_list_sparse_fields = {
+    name: column for name, column in blog_post_sparse_fields.items() if name not in ('content', 'rendered_content')
+}
+
+
+def get_invalid_tag_mode_response(request):
+    """400 response when tags_mode isn't one of TagFilterMode.choices, otherwise None"""
+
+    if get_tag_mode(request.query_params) is not None:
+        return None
+    return get_response_schema(
+        {'tags_mode': [ChoiceField.default_error_messages['invalid_choice'].format(
+            input=request.query_params['tags_mode']
+        )]},
+        ErrorMessage.BAD_REQUEST.value,
+        status.HTTP_400_BAD_REQUEST
+    )
+
+
+class SharedPayloadMixin:
+    """
+        Public views caching one payload for every reader: the per-request fields are filled by post id,
+        so `pk` is served whenever one of them is requested with `?fields=`.
+    """
+
+    per_request_fields = ('like_count', 'comment_count', 'liked_by_me')
+
+    def get_sparse_fields(self):
+        fields = super().get_sparse_fields()
+        if fields and 'pk' not in fields and any(name in self.per_request_fields for name in fields):
+            fields.insert(0, 'pk')
+        return fields
+
 
 # Create your views here.
 class BlogCreateAPIView(GenericAPIView):
@@ -65,33 +155,326 @@ class BlogCreateAPIView(GenericAPIView):
             )
 
 
-class BlogDetailAPIView(GenericAPIView):
+blog_bulk_item_schema = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'pk': openapi.Schema(type=openapi.TYPE_INTEGER, description='Blog post ID (update only)'),
+        'category': openapi.Schema(type=openapi.TYPE_INTEGER, description='Category ID'),
+        'title': openapi.Schema(type=openapi.TYPE_STRING, description='Title of the blog'),
+        'content': openapi.Schema(type=openapi.TYPE_STRING, description='Content of the blog'),
+        'excerpt': openapi.Schema(type=openapi.TYPE_STRING, description='Excerpt'),
+        'status': openapi.Schema(type=openapi.TYPE_STRING, description='Draft or Accepted'),
+        'tags': openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Items(type=openapi.TYPE_INTEGER),
+            description='List of tags'
+        )
+    }
+)
+
+
+class BlogBulkAPIView(GenericAPIView):
+    """View: Bulk Create, Bulk Update Blog Posts (User Only)"""
+
+    permission_classes = [IsUser]
+    authentication_classes = [JWTAuthentication]
+    lookup_context = {}
+
+    def get_items(self, request):
+        """The request body as a list of items, None when it is not a list or exceeds the batch limit"""
+
+        items = request.data
+        if not isinstance(items, list) or not items or len(items) > settings.BLOG_BULK_MAX_ITEMS:
+            return None
+        return items
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context.update(self.lookup_context)
+        return context
+
+    def get_lookup_id(self, value):
+        """The id as the item serializer's IntegerField coerces it ("5" is 5, True is rejected), None when invalid"""
+
+        try:
+            return serializers.IntegerField().to_internal_value(value)
+        except serializers.ValidationError:
+            return None
+
+    def load_lookups(self, items):
+        """One category and one tag query for the whole batch"""
+
+        category_ids, tag_ids = set(), set()
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            if item.get('category') is not None:
+                category_ids.add(self.get_lookup_id(item['category']))
+            if isinstance(item.get('tags'), list):
+                tag_ids.update(self.get_lookup_id(tag_id) for tag_id in item['tags'])
+        category_ids.discard(None)
+        tag_ids.discard(None)
+
+        self.lookup_context = {
+            'category_ids': set(
+                Category.active_objects.filter(pk__in=category_ids).values_list('pk', flat=True)
+            ),
+            'tag_ids': set(Tag.active_objects.filter(pk__in=tag_ids).values_list('pk', flat=True)),
+        }
+
+    def validate_items(self, items, partial=False):
+        """Validate every item on its own, returns ([(index, validated_data)], [{'index', 'errors'}])"""
+
+        self.load_lookups(items)
+
+        valid, errors = [], []
+        for index, item in enumerate(items):
+            serializer = BlogPostBulkItemSerializer(data=item, partial=partial, context=self.get_serializer_context())
+            if serializer.is_valid():
+                valid.append((index, serializer.validated_data))
+            else:
+                errors.append({'index': index, 'errors': serializer.errors})
+
+        return valid, errors
+
+    def write_tags(self, post_tags, replace=False):
+        """Write the tags of many posts in one INSERT (plus one DELETE when replacing), bypassing m2m_changed"""
+
+        through_model = BlogPost.tags.through
+        if replace:
+            through_model.objects.filter(blogpost_id__in=post_tags.keys()).delete()
+        through_model.objects.bulk_create([
+            through_model(blogpost_id=post_id, tag_id=tag_id)
+            for post_id, tag_ids in post_tags.items()
+            for tag_id in tag_ids
+        ])
+
+    def sync_posts(self, post_ids, published_post_ids):
+        # bulk_create/bulk_update skip the signals that keep search, the public feed and related posts in sync
+        refresh_search_documents(post_ids)
+        if published_post_ids:
+            transaction.on_commit(lambda: invalidate_feed(published_post_ids))
+            queue_related_refresh(published_post_ids)
+
+    @swagger_auto_schema(request_body=openapi.Schema(type=openapi.TYPE_ARRAY, items=blog_bulk_item_schema))
+    def post(self, request):
+
+        items = self.get_items(request)
+        if items is None:
+            return get_response_schema({}, ErrorMessage.BULK_LIMIT_EXCEEDED.value, status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            valid, errors = self.validate_items(items)
+
+            if not valid:
+                return get_response_schema(
+                    {'created': [], 'errors': errors},
+                    ErrorMessage.BAD_REQUEST.value,
+                    status.HTTP_400_BAD_REQUEST
+                )
+
+            posts = [
+                BlogPost(
+                    user=request.user,
+                    category_id=data.get('category'),
+                    title=data['title'],
+                    content=data['content'],
+                    excerpt=data.get('excerpt'),
+                    status=data.get('status', BlogPost.StatusChoice.DRAFT.value),
+                )
+                for _, data in valid
+            ]
+            # bulk_create skips the pre_save receiver that derives these
+            for post in posts:
+                derive_text_fields(post)
+            posts = BlogPost.objects.bulk_create(posts)
+
+            self.write_tags({
+                post.pk: data['tags'] for post, (_, data) in zip(posts, valid) if data.get('tags')
+            })
+            self.sync_posts(
+                [post.pk for post in posts],
+                [post.pk for post in posts if post.status == BlogPost.StatusChoice.PUBLISHED]
+            )
+
+        return get_response_schema(
+            {
+                'created': [{'index': index, 'pk': post.pk} for post, (index, _) in zip(posts, valid)],
+                'errors': errors
+            },
+            SuccessMessage.RECORD_CREATED.value,
+            status.HTTP_201_CREATED
+        )
+
+    @swagger_auto_schema(request_body=openapi.Schema(type=openapi.TYPE_ARRAY, items=blog_bulk_item_schema))
+    def put(self, request):
+
+        items = self.get_items(request)
+        if items is None:
+            return get_response_schema({}, ErrorMessage.BULK_LIMIT_EXCEEDED.value, status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            valid, errors = self.validate_items(items, partial=True)
+
+            # One query for every target post, only the caller's own active posts can be updated
+            posts = BlogPost.active_objects.filter(
+                user=request.user,
+                pk__in=[data['pk'] for _, data in valid if 'pk' in data]
+            ).in_bulk()
+
+            updated, fields, post_tags, published_post_ids = [], set(), {}, []
+            now = timezone.now()
+
+            for index, data in valid:
+                post = posts.get(data.get('pk'))
+                if post is None:
+                    errors.append({'index': index, 'errors': {'pk': [ErrorMessage.NOT_FOUND.value]}})
+                    continue
+
+                was_published = post.status == BlogPost.StatusChoice.PUBLISHED
+                for field, value in data.items():
+                    if field == 'pk':
+                        continue
+                    if field == 'tags':
+                        post_tags[post.pk] = value
+                        continue
+                    if field == 'category':
+                        field = 'category_id'
+                    setattr(post, field, value)
+                    fields.add(field)
+
+                if 'excerpt' in data:
+                    post.is_excerpt_generated = False
+                derive_text_fields(post)
+
+                # bulk_update bypasses auto_now
+                post.modified = now
+                updated.append((index, post))
+                if was_published or post.status == BlogPost.StatusChoice.PUBLISHED:
+                    published_post_ids.append(post.pk)
+
+            if not updated:
+                return get_response_schema(
+                    {'updated': [], 'errors': errors},
+                    ErrorMessage.BAD_REQUEST.value,
+                    status.HTTP_400_BAD_REQUEST
+                )
+
+            BlogPost.objects.bulk_update(
+                [post for _, post in updated], list(dict.fromkeys([*fields, *TEXT_FIELDS, 'modified']))
+            )
+            if post_tags:
+                self.write_tags(post_tags, replace=True)
+            self.sync_posts([post.pk for _, post in updated], published_post_ids)
+
+        errors.sort(key=lambda error: error['index'])
+        return get_response_schema(
+            {'updated': [{'index': index, 'pk': post.pk} for index, post in updated], 'errors': errors},
+            SuccessMessage.RECORD_UPDATED.value,
+            status.HTTP_200_OK
+        )
+
+
+class BlogExportAPIView(GenericAPIView):
+    """View: Export All Own Blog Posts as NDJSON or CSV (User Only)"""
+
+    permission_classes = [IsUser]
+    authentication_classes = [JWTAuthentication]
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter('export_format', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              enum=list(ExportFormat.choices), description='ndjson (default) or csv'),
+        ]
+    )
+    def get(self, request):
+
+        export_format = request.query_params.get('export_format', ExportFormat.NDJSON)
+        if export_format not in ExportFormat.choices:
+            return get_response_schema({}, ErrorMessage.BAD_REQUEST.value, status.HTTP_400_BAD_REQUEST)
+
+        # Server-side cursor on PostgreSQL, tags are prefetched per chunk so memory stays flat
+        posts = BlogPost.active_objects.filter(user=request.user).select_related('category').only(
+            'pk', 'title', 'content', 'excerpt', 'status', 'category', 'category__name', 'created', 'modified'
+        ).prefetch_related('tags').order_by('pk').iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+
+        stream = stream_csv(posts) if export_format == ExportFormat.CSV else stream_ndjson(posts)
+        response = StreamingHttpResponse(stream, content_type=ExportFormat.content_types[export_format])
+        response['Content-Disposition'] = f'attachment; filename="posts.{export_format}"'
+        return response
+
+
+class BlogDetailAPIView(SparseFieldsMixin, ExpandMixin, GenericAPIView):
     """View: Read, Update, Delete Blog Post(User Only)"""
 
     permission_classes = [IsUser]
     authentication_classes = [JWTAuthentication]
+    expandable_relations = {'category': 'select', 'user': 'select', 'tags': 'prefetch'}
+    # Columns that version the nested representation of an expanded relation, tags are always versioned
+    expanded_version_fields = {'category': 'category__modified', 'user': 'user__updated'}
+    sparse_fields = blog_post_sparse_fields
 
     def get_object(self, pk):
 
-        blog_queryset = BlogPost.objects.filter(pk=pk, is_active=True)
+        # The search document is only read by the search queries
+        blog_queryset = self.apply_sparse_fields(self.apply_expand(
+            BlogPost.active_objects.filter(pk=pk).defer('search_vector')
+        ))
+        blog_queryset = annotate_liked_by_me(blog_queryset, self.request.user)
 
         if blog_queryset:
             return blog_queryset[0]
         return None
 
+    def get_version(self, pk):
+        """Cheap probe of the columns that change the representation, without loading content"""
+
+        version_fields = [
+            self.expanded_version_fields[name] for name in self.get_expand() if name in self.expanded_version_fields
+        ]
+        version = BlogPost.active_objects.filter(pk=pk).values(
+            'modified', 'like_count', 'comment_count', 'image_variants', *version_fields
+        ).first()
+
+        if version:
+            # Tag changes don't touch the post row, and the tag ids are serialized even when not expanded
+            version['tags'] = list(
+                BlogPost.tags.through.objects.filter(blogpost_id=pk).order_by('tag_id')
+                .values_list('tag_id', 'tag__modified')
+            )
+        return version
+
+    @swagger_auto_schema(manual_parameters=[expand_parameter, fields_parameter])
     def get(self, request, pk):
 
         if not pk:
             return get_response_schema({}, ErrorMessage.BAD_REQUEST.value, status.HTTP_400_BAD_REQUEST)
 
+        version = self.get_version(pk)
+
+        if not version:
+            return get_response_schema({}, ErrorMessage.NOT_FOUND.value, status.HTTP_404_NOT_FOUND)
+
+        # Counters, variants and relations change without touching `modified`, so only the ETag validates,
+        # a Last-Modified would answer 304 to If-Modified-Since after a like
+        etag, _ = get_record_validators(version['modified'], pk, json.dumps(version, sort_keys=True, default=str))
+        not_modified_response = get_not_modified_response(request, etag, None)
+        if not_modified_response:
+            return not_modified_response
+
         blog = self.get_object(pk)
 
         if not blog:
             return get_response_schema({}, ErrorMessage.NOT_FOUND.value, status.HTTP_404_NOT_FOUND)
 
-        serializer = BlogPostDisplaySerializer(blog)
+        serializer = BlogPostDisplaySerializer(blog, context=self.get_serializer_context())
 
-        return get_response_schema(serializer.data, SuccessMessage.RECORD_RETRIEVED.value, status.HTTP_200_OK)
+        # Only a served body is a view, a 304 revalidation isn't. Buffered, flushed in batches so hot posts
+        # don't serialize readers on a row lock
+        view_count_buffer.record(pk)
+
+        response = get_response_schema(serializer.data, SuccessMessage.RECORD_RETRIEVED.value, status.HTTP_200_OK)
+        return set_validator_headers(response, etag, None)
 
     @swagger_auto_schema(
         request_body=openapi.Schema(
@@ -145,17 +528,27 @@ class BlogDetailAPIView(GenericAPIView):
         return get_response_schema({}, SuccessMessage.RECORD_DELETED.value, status.HTTP_204_NO_CONTENT)
 
 
-class BlogListFilterAPIView(ListAPIView):
+class BlogListFilterAPIView(SparseFieldsMixin, ExpandMixin, CursorPaginationMixin, ListAPIView):
     """View: Blog List Filter(Only User)"""
 
     permission_classes = [IsUser]
     authentication_classes = [JWTAuthentication]
-    serializer_class = BlogPostDisplaySerializer
+    serializer_class = BlogPostListFilterDisplaySerializer
     pagination_class = CustomPageNumberPagination
+    cursor_ordering = ('-modified', '-id')
+    expandable_relations = {'category': 'select', 'user': 'select', 'tags': 'prefetch'}
+    sparse_fields = blog_post_list_sparse_fields
+    # Search results are ordered by relevance, which the cursor's keyset ordering would discard
+    page_number_only_params = ('search',)
 
     def get_queryset(self):
 
-        blog_queryset = self.request.user.user_blog_posts.filter(is_active=True)
+        # Tags are always prefetched, their PKs are serialized even when not expanded
+        blog_queryset = self.apply_sparse_fields(self.apply_expand(
+            BlogPost.active_objects.filter(user=self.request.user).defer('content', 'search_vector')
+            .prefetch_related('tags')
+        ))
+        blog_queryset = annotate_liked_by_me(blog_queryset, self.request.user)
 
         # Filter by title
         title = self.request.query_params.get('title')
@@ -167,31 +560,226 @@ class BlogListFilterAPIView(ListAPIView):
         if category is not None:
             blog_queryset = blog_queryset.filter(category=category)
 
-        # Filter by multiple tags
-        tags_list = self.request.query_params.getlist('tags')
-        if tags_list is not None:
-            tag_ids = [tag for tag in tags_list]
-            if tag_ids:
-                blog_queryset = blog_queryset.filter(tags__in=tag_ids).distinct()
+        # Filter by multiple tags, any of them by default or all of them with tags_mode=all
+        tag_ids = get_tag_ids(self.request.query_params.getlist('tags'))
+        if tag_ids:
+            blog_queryset = filter_by_tags(blog_queryset, tag_ids, get_tag_mode(self.request.query_params))
 
         # Filter by status
         status = self.request.query_params.get('status')
         if status is not None:
             blog_queryset = blog_queryset.filter(status=status)
 
+        # Full-text search over title, excerpt, content and tags, ordered by relevance
+        search = self.request.query_params.get('search')
+        if search is not None:
+            blog_queryset = search_posts(blog_queryset, search)
+
         return blog_queryset
     @swagger_auto_schema(
         manual_parameters=[
             openapi.Parameter('title', openapi.IN_QUERY, type=openapi.TYPE_STRING, description='Title'),
             openapi.Parameter('category', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description='Category'),
             openapi.Parameter('tags', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description='Tags'),
+            tags_mode_parameter,
             openapi.Parameter('status', openapi.IN_QUERY, type=openapi.TYPE_STRING, enum=[choice[0] for choice in BlogPost.StatusChoice.choices], description='Status'),
+            openapi.Parameter('search', openapi.IN_QUERY, type=openapi.TYPE_STRING, description='Full-text search, ordered by relevance and paginated by page number'),
+            expand_parameter,
+            fields_parameter,
+            *cursor_pagination_parameters,
         ]
     )
     def get(self, request, *args, **kwargs):
+
+        invalid_tag_mode_response = get_invalid_tag_mode_response(request)
+        if invalid_tag_mode_response:
+            return invalid_tag_mode_response
+
         return self.list(request, *args, **kwargs)
 
 
+class PublicBlogListAPIView(SharedPayloadMixin, SparseFieldsMixin, ExpandMixin, CursorPaginationMixin, ListAPIView):
+    """View: Published Blog Feed(Public, cached)"""
 
+    permission_classes = [AllowAny]
+    # Optional, only to fill liked_by_me for signed in readers
+    authentication_classes = [OptionalJWTAuthentication]
+    serializer_class = BlogPostListFilterDisplaySerializer
+    pagination_class = CustomPageNumberPagination
+    cursor_ordering = ('-modified', '-id')
+    expandable_relations = {'category': 'select', 'user': 'select', 'tags': 'prefetch'}
+    sparse_fields = blog_post_list_sparse_fields
+    # Search results are ordered by relevance, which the cursor's keyset ordering would discard
+    page_number_only_params = ('search',)
 
+    def get_queryset(self):
+
+        blog_queryset = self.apply_sparse_fields(self.apply_expand(BlogPost.active_objects.filter(
+            status=BlogPost.StatusChoice.PUBLISHED
+        ).defer('content', 'search_vector').prefetch_related('tags')))
+
+        # Filter by category
+        category = self.request.query_params.get('category')
+        if category is not None:
+            blog_queryset = blog_queryset.filter(category=category)
+
+        # Filter by multiple tags, any of them by default or all of them with tags_mode=all
+        tag_ids = get_tag_ids(self.request.query_params.getlist('tags'))
+        if tag_ids:
+            blog_queryset = filter_by_tags(blog_queryset, tag_ids, get_tag_mode(self.request.query_params))
+
+        # Full-text search over title, excerpt, content and tags, ordered by relevance
+        search = self.request.query_params.get('search')
+        if search is not None:
+            blog_queryset = search_posts(blog_queryset, search)
+
+        return blog_queryset
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter('category', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description='Category'),
+            openapi.Parameter('tags', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description='Tags'),
+            tags_mode_parameter,
+            openapi.Parameter('search', openapi.IN_QUERY, type=openapi.TYPE_STRING, description='Full-text search, ordered by relevance and paginated by page number'),
+            expand_parameter,
+            fields_parameter,
+            *cursor_pagination_parameters,
+        ]
+    )
+    def get(self, request, *args, **kwargs):
+
+        invalid_tag_mode_response = get_invalid_tag_mode_response(request)
+        if invalid_tag_mode_response:
+            return invalid_tag_mode_response
+
+        cache_key = get_feed_list_key(request.query_params)
+        data = get_cached(cache_key)
+
+        if data is None:
+            data = get_cacheable_page(self.list(request, *args, **kwargs).data)
+            set_cached(cache_key, data)
+
+        # The cached page is shared by every reader and outlives counter writes, the like state,
+        # the counters and the links' host are per request
+        data = get_page_for_request(data, request)
+        set_liked_by_me(data['results'], request.user)
+        set_current_counters(data['results'])
+
+        return Response(data)
+
+
+class PublicBlogDetailAPIView(SharedPayloadMixin, SparseFieldsMixin, ExpandMixin, GenericAPIView):
+    """View: Read Published Blog Post(Public, cached)"""
+
+    permission_classes = [AllowAny]
+    # Optional, only to fill liked_by_me for signed in readers
+    authentication_classes = [OptionalJWTAuthentication]
+    expandable_relations = {'category': 'select', 'user': 'select', 'tags': 'prefetch'}
+    sparse_fields = blog_post_sparse_fields
+
+    def get_object(self, pk):
+
+        blog_queryset = self.apply_sparse_fields(self.apply_expand(BlogPost.active_objects.filter(
+            pk=pk,
+            status=BlogPost.StatusChoice.PUBLISHED
+        ).defer('search_vector')))
+
+        if blog_queryset:
+            return blog_queryset[0]
+        return None
+
+    @swagger_auto_schema(manual_parameters=[expand_parameter, fields_parameter])
+    def get(self, request, pk):
+
+        if not pk:
+            return get_response_schema({}, ErrorMessage.BAD_REQUEST.value, status.HTTP_400_BAD_REQUEST)
+
+        variant = f"{','.join(sorted(self.get_expand()))}|{','.join(sorted(self.get_sparse_fields()))}"
+        data = get_cached_detail(pk, variant)
+
+        if data is None:
+            blog = self.get_object(pk)
+
+            if not blog:
+                return get_response_schema({}, ErrorMessage.NOT_FOUND.value, status.HTTP_404_NOT_FOUND)
+
+            data = BlogPostDisplaySerializer(blog, context=self.get_serializer_context()).data
+            set_cached_detail(pk, variant, data)
+
+        set_liked_by_me([data], request.user)
+        set_current_counters([data])
+        # Recorded only once the 200 body is known, like the owner detail
+        view_count_buffer.record(pk)
+
+        return get_response_schema(data, SuccessMessage.RECORD_RETRIEVED.value, status.HTTP_200_OK)
+
+
+class PublicRelatedBlogListAPIView(GenericAPIView):
+    """View: Related Posts of a Published Blog Post(Public)"""
+
+    permission_classes = [AllowAny]
+    # Optional, only to fill liked_by_me for signed in readers
+    authentication_classes = [OptionalJWTAuthentication]
+
+    def get(self, request, pk):
+
+        # Precomputed neighbours, read in rank order from the (post, rank) index
+        related_entries = RelatedPost.objects.filter(
+            post_id=pk,
+            related__is_active=True,
+            related__status=BlogPost.StatusChoice.PUBLISHED
+        ).select_related('related').defer('related__content', 'related__search_vector').prefetch_related(
+            'related__tags'
+        ).order_by('rank')
+
+        data = []
+        for entry in related_entries:
+            post_data = BlogPostListFilterDisplaySerializer(entry.related).data
+            post_data['score'] = round(entry.score, 4)
+            data.append(post_data)
+        set_liked_by_me(data, request.user)
+
+        return get_response_schema(data, SuccessMessage.RECORD_RETRIEVED.value, status.HTTP_200_OK)
+
+
+class PublicTrendingBlogListAPIView(GenericAPIView):
+    """View: Trending Published Blog Posts(Public)"""
+
+    permission_classes = [AllowAny]
+    # Optional, only to fill liked_by_me for signed in readers
+    authentication_classes = [OptionalJWTAuthentication]
+    max_limit = 50
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter('limit', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                              description='Number of posts, at most 50 (default 10)'),
+        ]
+    )
+    def get(self, request):
+
+        try:
+            limit = serializers.IntegerField(min_value=1, max_value=self.max_limit).run_validation(
+                request.query_params.get('limit', 10)
+            )
+        except serializers.ValidationError as error:
+            return get_response_schema(
+                {'limit': error.detail}, ErrorMessage.BAD_REQUEST.value, status.HTTP_400_BAD_REQUEST
+            )
 
+        # Top of the score index, the decay is folded into the stored score so no aggregation happens here
+        trending_entries = TrendingScore.objects.filter(
+            post__is_active=True,
+            post__status=BlogPost.StatusChoice.PUBLISHED
+        ).select_related('post').defer('post__content', 'post__search_vector').prefetch_related(
+            'post__tags'
+        ).order_by('-log_score')[:limit]
+
+        data = []
+        for entry in trending_entries:
+            post_data = BlogPostListFilterDisplaySerializer(entry.post).data
+            post_data['trending_score'] = round(get_current_score(entry.log_score), 4)
+            data.append(post_data)
+        set_liked_by_me(data, request.user)
+
+        return get_response_schema(data, SuccessMessage.RECORD_RETRIEVED.value, status.HTTP_200_OK)
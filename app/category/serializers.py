@@ -11,7 +11,7 @@ class CategoryCreateSerializer(serializers.ModelSerializer):
     def validate_name(self, value):
         name = value.strip()
 
-        if Category.objects.filter(name__iexact=name, is_active=True).exists():
+        if Category.active_objects.filter(name__iexact=name).exists():
             raise serializers.ValidationError("Category already in use")
 
         return name.capitalize()
@@ -25,7 +25,7 @@ class CategoryUpdateSerializer(serializers.ModelSerializer):
     def validate_name(self, value):
         name = value.strip()
 
-        if Category.objects.filter(name__iexact=name, is_active=True).exclude(pk=self.instance.pk).exists():
+        if Category.active_objects.filter(name__iexact=name).exclude(pk=self.instance.pk).exists():
             raise serializers.ValidationError("Category already in use")
 
         return name.capitalize()
@@ -10,9 +10,9 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from app.category.models import Category
 from app.category.serializers import CategoryCreateSerializer, CategoryDisplaySerializer, \
     CategoryListFilterDisplaySerializer, CategoryUpdateSerializer
-from app.core.views import CustomPageNumberPagination
+from app.core.views import CustomPageNumberPagination, CursorPaginationMixin, cursor_pagination_parameters
 from app.global_constants import SuccessMessage, ErrorMessage
-from app.utils import get_response_schema
+from app.utils import get_response_schema, get_record_validators, get_not_modified_response, set_validator_headers
 from permissions import IsAdmin, IsUser, IsAdminOrUser
 
 logger = logging.getLogger('django')
@@ -48,12 +48,17 @@ class CategoryDetailAPI(GenericAPIView):
 
     def get_object(self, pk):
 
-        category_queryset = (Category.objects.filter(pk=pk,is_active=True)
+        category_queryset = (Category.active_objects.filter(pk=pk)
                          .only('name'))
         if category_queryset:
             return category_queryset[0]
         return None
 
+    def get_version(self, pk):
+        """Cheap probe of the modified timestamp before loading the row"""
+
+        return Category.active_objects.filter(pk=pk).values('modified').first()
+
     def get(self, request, pk):
 
         logger.info(f"Category accessed by user: {request.user}. Requested user ID: {pk}")
@@ -62,6 +67,21 @@ class CategoryDetailAPI(GenericAPIView):
             logger.warning("Bad request: No primary key provided.")
             return get_response_schema({}, ErrorMessage.BAD_REQUEST.value, status.HTTP_400_BAD_REQUEST)
 
+        version = self.get_version(pk)
+        if not version:
+            logger.error(f"Error retrieving category with ID {pk}", exc_info=True)
+            return get_response_schema(
+                {},
+                ErrorMessage.NOT_FOUND.value,
+                status.HTTP_404_NOT_FOUND
+            )
+
+        etag, last_modified = get_record_validators(version['modified'], pk)
+        not_modified_response = get_not_modified_response(request, etag, last_modified)
+        if not_modified_response:
+            logger.info(f"Category with ID {pk} not modified")
+            return not_modified_response
+
         category = self.get_object(pk)
         if not category:
             logger.error(f"Error retrieving category with ID {pk}", exc_info=True)
@@ -73,11 +93,12 @@ class CategoryDetailAPI(GenericAPIView):
 
         serializer = CategoryDisplaySerializer(category)
         logger.info(f"Successfully retrieved category with ID {pk}")
-        return get_response_schema(
+        response = get_response_schema(
             serializer.data,
             SuccessMessage.RECORD_RETRIEVED.value,
             status.HTTP_200_OK
         )
+        return set_validator_headers(response, etag, last_modified)
 
     def delete(self, request, pk):
 
@@ -147,11 +168,12 @@ class CategoryDetailAPI(GenericAPIView):
             status.HTTP_400_BAD_REQUEST
         )
 
-class CategoryListFilterAPIView(ListAPIView):
+class CategoryListFilterAPIView(CursorPaginationMixin, ListAPIView):
     """ View: Post List Filter"""
 
     serializer_class = CategoryListFilterDisplaySerializer
     pagination_class = CustomPageNumberPagination
+    cursor_ordering = ('-created', '-id')
 
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAdminOrUser]
@@ -161,10 +183,8 @@ class CategoryListFilterAPIView(ListAPIView):
         query_params = self.request.query_params
 
         # Only fetch necessary fields to optimize performance
-        queryset = Category.objects.filter(
-            is_active=True,
-        ).only(
-            'pk','name'
+        queryset = Category.active_objects.only(
+            'pk','name', 'created'
         ).order_by('-created')
 
         # Extract filters
@@ -180,7 +200,7 @@ class CategoryListFilterAPIView(ListAPIView):
         manual_parameters=[
             openapi.Parameter('name', openapi.IN_QUERY, type=openapi.TYPE_STRING,
                               description='Filter by name of category'),
-
+            *cursor_pagination_parameters,
         ]
     )
     def get(self, request, *args, **kwargs):
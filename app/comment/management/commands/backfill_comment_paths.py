@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from app.comment.models import Comment
+from app.comment.threads import fill_root_paths
+
+
+class Command(BaseCommand):
+    help = "Write the thread path of top level comments created before reply threading"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        comment_ids = Comment.objects.filter(parent__isnull=True, path='').order_by('pk').values_list('pk', flat=True)
+        batch = []
+        total = 0
+
+        for comment_id in comment_ids.iterator(chunk_size=batch_size):
+            batch.append(comment_id)
+            if len(batch) == batch_size:
+                total += fill_root_paths(Comment.objects.filter(pk__in=batch))
+                batch = []
+
+        if batch:
+            total += fill_root_paths(Comment.objects.filter(pk__in=batch))
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled thread paths for {total} comments"))
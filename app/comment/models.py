@@ -1,4 +1,7 @@
 from django.db import models
+from django.db.models import Q
+
+from app.core.models import ActiveManager, ActiveQuerySet
 
 # Create your models here.
 class Comment(models.Model):
@@ -14,9 +17,37 @@ class Comment(models.Model):
         related_name='post_comments',
         related_query_name='post_comment'
     )
+    # Reply threading as a materialized path: the zero padded ids of the ancestors then of the comment itself,
+    # so a subtree is one range of `path` and sorting by it gives the rendering order
+    parent = models.ForeignKey(
+        'self',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='replies',
+        related_query_name='reply'
+    )
+    path = models.CharField(max_length=255, blank=True, default='', editable=False)
+    depth = models.PositiveSmallIntegerField(default=0, editable=False)
+    # Active direct replies, maintained with the insert
+    reply_count = models.PositiveIntegerField(default=0, editable=False)
+
     content = models.TextField()
 
     # Additional field declarations
     is_active = models.BooleanField(default=True)
     created = models.DateTimeField(auto_now_add=True)
-    modified = models.DateTimeField(auto_now=True)
\ No newline at end of file
+    modified = models.DateTimeField(auto_now=True)
+
+    # Every row, soft deleted ones included; `active_objects` for live rows
+    objects = ActiveQuerySet.as_manager()
+    active_objects = ActiveManager()
+
+    class Meta:
+        indexes = [
+            # Active comments of a post: CommentListAPIView keyset pages on (created, id) and the counter rebuild
+            models.Index(fields=['blog_post', 'created', 'id'], name='comment_post_created_idx',
+                         condition=Q(is_active=True)),
+            # Thread and subtree reads: CommentThreadAPIView range scans in path order
+            models.Index(fields=['path'], name='comment_path_idx', condition=Q(is_active=True)),
+        ]
@@ -1,9 +1,31 @@
 from rest_framework import serializers
 
 from app.comment.models import Comment
+from app.comment.threads import MAX_DEPTH, create_comment
+from app.user.serializers import UserAuthorDisplaySerializer
 
 
 class CommentCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Comment
-        fields = ('user', 'blog_post', 'content')
\ No newline at end of file
+        fields = ('pk', 'user', 'blog_post', 'parent', 'depth', 'content')
+
+    def validate(self, attrs):
+        parent = attrs.get('parent')
+        if parent is not None:
+            if not parent.is_active or parent.blog_post_id != attrs['blog_post'].pk:
+                raise serializers.ValidationError({'parent': ["Reply to an active comment of the same post"]})
+            if parent.depth >= MAX_DEPTH:
+                raise serializers.ValidationError({'parent': [f"Replies can't be nested more than {MAX_DEPTH} levels"]})
+        return attrs
+
+    def create(self, validated_data):
+        return create_comment(**validated_data)
+
+
+class CommentDisplaySerializer(serializers.ModelSerializer):
+    user = UserAuthorDisplaySerializer(read_only=True)
+
+    class Meta:
+        model = Comment
+        fields = ('pk', 'user', 'parent', 'depth', 'reply_count', 'content', 'created', 'modified')
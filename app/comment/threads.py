@@ -0,0 +1,53 @@
+from django.db.models import CharField, F, Value
+from django.db.models.functions import Cast, LPad
+
+# Digits per path segment, enough for ids up to 10^10
+PATH_SEGMENT_LENGTH = 10
+# Deepest reply level accepted, top level comments are depth 0; keeps `path` within its 255 characters
+MAX_DEPTH = 20
+
+
+def get_path_segment(comment_id):
+    return f'{comment_id:0{PATH_SEGMENT_LENGTH}d}'
+
+
+def get_subtree_bounds(path):
+    """
+        [lower, upper) range of `path` holding the comment and all of its replies.
+        The upper bound is the next sibling's path, digits compare the same way in every collation.
+    """
+
+    parent_path, segment = path[:-PATH_SEGMENT_LENGTH], path[-PATH_SEGMENT_LENGTH:]
+    return path, parent_path + get_path_segment(int(segment) + 1)
+
+
+def filter_subtree(queryset, path):
+    """The comment with `path` and its replies at every depth, one index range scan, ready to render in path order"""
+
+    lower, upper = get_subtree_bounds(path)
+    return queryset.filter(path__gte=lower, path__lt=upper).order_by('path')
+
+
+def create_comment(parent=None, **fields):
+    """Insert a comment or a reply, setting its path and depth and counting it on the parent"""
+
+    from app.comment.models import Comment
+
+    comment = Comment.objects.create(parent=parent, depth=parent.depth + 1 if parent else 0, **fields)
+
+    # The path ends with the comment's own id, so it's written once the id is known
+    comment.path = (parent.path if parent else '') + get_path_segment(comment.pk)
+    Comment.objects.filter(pk=comment.pk).update(path=comment.path)
+
+    if parent is not None:
+        Comment.objects.filter(pk=parent.pk).update(reply_count=F('reply_count') + 1)
+
+    return comment
+
+
+def fill_root_paths(queryset):
+    """Path of top level comments written before threading (or inserted in bulk), one UPDATE"""
+
+    return queryset.filter(parent__isnull=True, path='').update(
+        path=LPad(Cast('pk', CharField()), PATH_SEGMENT_LENGTH, Value('0'))
+    )
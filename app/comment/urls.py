@@ -1,9 +1,11 @@
 from django.urls import path
 
-from app.comment.views import CommentCreateAPIView
+from app.comment.views import CommentCreateAPIView, CommentListAPIView, CommentThreadAPIView
 
 urlpatterns = [
 
     path("", CommentCreateAPIView.as_view(),name="post-create"),
+    path('post/<int:blog_post>/', CommentListAPIView.as_view(), name='comment-list'),
+    path('<int:pk>/thread/', CommentThreadAPIView.as_view(), name='comment-thread'),
 
 ]
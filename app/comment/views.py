@@ -1,16 +1,31 @@
+from django.db import transaction
 from django.shortcuts import render
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
-from rest_framework.generics import GenericAPIView
+from rest_framework.generics import GenericAPIView, ListAPIView
+from rest_framework.permissions import AllowAny
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
-from app.comment.serializers import CommentCreateSerializer
+from app.article.counters import adjust_comment_count
+from app.article.models import BlogPost
+from app.comment.models import Comment
+from app.comment.serializers import CommentCreateSerializer, CommentDisplaySerializer
+from app.comment.threads import filter_subtree
+from app.core.views import SignedCursorPagination
 from app.global_constants import SuccessMessage, ErrorMessage
 from app.utils import get_response_schema
 from permissions import IsUser
 
 
+# Columns read by CommentDisplaySerializer, author included
+comment_display_columns = (
+    'pk', 'parent', 'depth', 'reply_count', 'content', 'created', 'modified', 'user',
+    'user__username', 'user__first_name', 'user__last_name', 'user__profile_picture',
+    'user__profile_picture_variants',
+)
+
+
 # Create your views here.
 class CommentCreateAPIView(GenericAPIView):
 
@@ -22,18 +37,81 @@ class CommentCreateAPIView(GenericAPIView):
             type=openapi.TYPE_OBJECT,
             properties={
                 'blog_post': openapi.Schema(type=openapi.TYPE_INTEGER, description='Blog post id'),
+                'parent': openapi.Schema(type=openapi.TYPE_INTEGER, description='Id of the comment replied to'),
                 'content': openapi.Schema(type=openapi.TYPE_STRING, description='Comment'),
             }
         )
     )
     def post(self, request):
+        with transaction.atomic():
+            request.data['user'] = request.user.id
+
+            serializer = CommentCreateSerializer(data=request.data)
+            if serializer.is_valid():
+                comment = serializer.save()
+                adjust_comment_count(comment.blog_post_id, 1)
+                return get_response_schema(serializer.data,SuccessMessage.RECORD_CREATED.value, status.HTTP_201_CREATED)
+
+            return get_response_schema(serializer.errors, ErrorMessage.BAD_REQUEST.value, status.HTTP_400_BAD_REQUEST)
+
+
+class CommentListAPIView(ListAPIView):
+    """View: Comments of a Published Blog Post(Public), oldest first"""
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    serializer_class = CommentDisplaySerializer
+    # Keyset pages read straight from the (blog_post, created, id) partial index, whatever the comment count
+    pagination_class = SignedCursorPagination
+    cursor_ordering = ('created', 'id')
+
+    def get_queryset(self):
+
+        return Comment.active_objects.filter(
+            blog_post_id=self.kwargs['blog_post']
+        ).select_related('user').only(*comment_display_columns)
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter('cursor', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description='Cursor token from a previous next/previous link'),
+            openapi.Parameter('size', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, description='Page size'),
+        ]
+    )
+    def get(self, request, *args, **kwargs):
+
+        if not BlogPost.active_objects.filter(
+            pk=kwargs['blog_post'],
+            status=BlogPost.StatusChoice.PUBLISHED
+        ).exists():
+            return get_response_schema({}, ErrorMessage.NOT_FOUND.value, status.HTTP_404_NOT_FOUND)
+
+        return self.list(request, *args, **kwargs)
+
+
+class CommentThreadAPIView(GenericAPIView):
+    """View: A Comment and All of its Replies(Public), in rendering order"""
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    max_comments = 1000
+
+    def get(self, request, pk):
 
-        request.data['user'] = request.user.id
+        comment = Comment.active_objects.filter(
+            pk=pk,
+            blog_post__is_active=True,
+            blog_post__status=BlogPost.StatusChoice.PUBLISHED
+        ).only('path').first()
 
-        serializer = CommentCreateSerializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save()
-            return get_response_schema(serializer.data,SuccessMessage.RECORD_CREATED.value, status.HTTP_201_CREATED)
+        if not comment:
+            return get_response_schema({}, ErrorMessage.NOT_FOUND.value, status.HTTP_404_NOT_FOUND)
 
-        return get_response_schema(serializer.errors, ErrorMessage.BAD_REQUEST.value, status.HTTP_400_BAD_REQUEST)
+        # Depth first, replies right after their parent; clients indent by `depth`
+        thread = filter_subtree(
+            Comment.active_objects.select_related('user').only(*comment_display_columns),
+            comment.path
+        )[:self.max_comments]
 
+        data = CommentDisplaySerializer(thread, many=True).data
+        return get_response_schema(data, SuccessMessage.RECORD_RETRIEVED.value, status.HTTP_200_OK)
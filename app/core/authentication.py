@@ -0,0 +1,13 @@
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+
+class OptionalJWTAuthentication(JWTAuthentication):
+    """JWT authentication for public endpoints: a missing, expired or invalid token reads as anonymous, never a 401"""
+
+    def authenticate(self, request):
+        try:
+            return super().authenticate(request)
+        except (InvalidToken, AuthenticationFailed):
+            return None
@@ -0,0 +1,156 @@
+import atexit
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+logger = logging.getLogger('django')
+
+# (variant name, longest side in px, output format), None keeps JPEG/PNG depending on transparency
+IMAGE_VARIANTS = (
+    ('thumbnail', 320, None),
+    ('medium', 1024, None),
+    ('webp', 2048, 'WEBP'),
+)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """Worker pool created on first use so commands and migrations never spawn it"""
+
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.IMAGE_VARIANT_WORKERS,
+                    thread_name_prefix='image-variants'
+                )
+                atexit.register(_executor.shutdown)
+    return _executor
+
+
+def _render_variant(image, max_size, image_format):
+    """Downscale (never upscale) and encode one variant, returns (bytes, extension)"""
+
+    has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+    if image_format is None:
+        image_format = 'PNG' if has_alpha else 'JPEG'
+
+    variant = image.convert('RGBA' if has_alpha and image_format != 'JPEG' else 'RGB')
+    variant.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+
+    output = BytesIO()
+    if image_format == 'JPEG':
+        variant.save(output, 'JPEG', quality=82, optimize=True, progressive=True)
+        extension = 'jpg'
+    elif image_format == 'PNG':
+        variant.save(output, 'PNG', optimize=True)
+        extension = 'png'
+    else:
+        variant.save(output, 'WEBP', quality=80, method=4)
+        extension = 'webp'
+
+    return output.getvalue(), extension
+
+
+def build_image_variants(file_field):
+    """
+        Write every variant of an image next to it and return {variant name: url}.
+        Image fields use ContentAddressedStorage, which names a variant after its bytes: an identical variant
+        is shared, not overwritten, so nothing is ever deleted here.
+    """
+
+    storage = file_field.storage
+
+    with storage.open(file_field.name, 'rb') as source:
+        image = Image.open(source)
+        # Apply the EXIF rotation before the metadata is dropped
+        image = ImageOps.exif_transpose(image)
+        image.load()
+
+    variants = {'source': file_field.name}
+    for variant, max_size, image_format in IMAGE_VARIANTS:
+        content, extension = _render_variant(image, max_size, image_format)
+        name = os.path.join(os.path.dirname(file_field.name), 'variants', f'{variant}.{extension}')
+        variants[variant] = storage.url(storage.save(name, ContentFile(content)))
+
+    return variants
+
+
+def generate_image_variants(model, pk, field_name, variants_field, timestamp_field=None, on_update=None):
+    """
+        Build the variants of one record's image and store their urls.
+        The UPDATE only applies while the record still points to the same file, so a job finishing
+        after a newer upload never overwrites the newer variants.
+    """
+
+    instance = model.objects.filter(pk=pk).only('pk', field_name).first()
+    file_field = getattr(instance, field_name, None)
+    if not file_field:
+        return False
+
+    try:
+        variants = build_image_variants(file_field)
+    except Exception:
+        logger.error(f"Failed to build image variants of {model.__name__} {pk}", exc_info=True)
+        return False
+
+    values = {variants_field: variants}
+    if timestamp_field:
+        # Bump the timestamp so ETags and cached representations pick up the variants,
+        # only for models whose timestamp doesn't order any listing
+        values[timestamp_field] = timezone.now()
+
+    updated = model.objects.filter(pk=pk, **{field_name: file_field.name}).update(**values)
+    if updated and on_update:
+        on_update(pk)
+    return bool(updated)
+
+
+def _run_job(*args, **kwargs):
+    try:
+        generate_image_variants(*args, **kwargs)
+    finally:
+        # Worker threads own their connection, release it between jobs
+        connection.close()
+
+
+def reset_stale_variants(instance, field_name, variants_field):
+    """pre_save: drop the variants of a replaced or removed image, skipped when either field is deferred"""
+
+    values = instance.__dict__
+    if field_name not in values or variants_field not in values:
+        return
+
+    file_field = getattr(instance, field_name)
+    variants = values[variants_field] or {}
+    if variants.get('source') != (file_field.name if file_field else None):
+        setattr(instance, variants_field, {})
+
+
+def schedule_image_variants(instance, field_name, variants_field, timestamp_field=None, on_update=None):
+    """post_save: queue the variant build of an image without variants once the transaction commits"""
+
+    values = instance.__dict__
+    if field_name not in values or variants_field not in values:
+        return
+    if not getattr(instance, field_name) or values[variants_field]:
+        return
+
+    model, pk = type(instance), instance.pk
+    transaction.on_commit(
+        lambda: _get_executor().submit(
+            _run_job, model, pk, field_name, variants_field, timestamp_field, on_update
+        )
+    )
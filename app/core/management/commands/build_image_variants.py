@@ -0,0 +1,33 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from app.article.cache import invalidate_feed
+from app.article.models import BlogPost
+from app.core.images import generate_image_variants
+
+
+class Command(BaseCommand):
+    help = "Build the missing resized variants of blog post images and profile pictures"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help="Rebuild variants that already exist too")
+
+    def handle(self, *args, **options):
+        targets = (
+            # BlogPost.modified orders the feeds and is left alone, the detail ETag covers image_variants
+            (BlogPost, 'image', 'image_variants', None, lambda pk: invalidate_feed([pk])),
+            (get_user_model(), 'profile_picture', 'profile_picture_variants', 'updated', None),
+        )
+
+        for model, field_name, variants_field, timestamp_field, on_update in targets:
+            queryset = model.objects.exclude(**{f'{field_name}__isnull': True}).exclude(**{field_name: ''})
+            if not options['all']:
+                queryset = queryset.filter(**{variants_field: {}})
+
+            total = 0
+            for pk in queryset.order_by('pk').values_list('pk', flat=True).iterator():
+                total += generate_image_variants(
+                    model, pk, field_name, variants_field, timestamp_field, on_update
+                )
+
+            self.stdout.write(self.style.SUCCESS(f"Built image variants for {total} {model._meta.verbose_name_plural}"))
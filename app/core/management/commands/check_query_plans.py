@@ -0,0 +1,243 @@
+import random
+from datetime import datetime
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from app.article.filters import TagFilterMode, filter_by_tags
+from app.article.models import BlogPost, RelatedPost, TrendingScore
+from app.category.models import Category
+from app.comment.models import Comment
+from app.comment.threads import fill_root_paths, filter_subtree
+from app.global_constants import GlobalValues
+from app.like.models import Like
+from app.role.models import Role
+from app.tag.models import Tag
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN the hot query shapes on PostgreSQL and fail if one doesn't use its intended index. "
+        "A sample data set is inserted and analyzed inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=50000, help="Sample posts to insert before explaining")
+
+    def seed(self, post_count):
+        """Insert a sample data set with production-like selectivity and return (user_id, post_id)"""
+
+        rng = random.Random(0)
+        batch_size = 5000
+
+        role, _ = Role.objects.get_or_create(pk=GlobalValues.USER.value, defaults={'name': 'Regular User'})
+        admin_role, _ = Role.objects.get_or_create(pk=GlobalValues.ADMIN.value, defaults={'name': 'Admin'})
+        users = get_user_model().objects.bulk_create([
+            get_user_model()(
+                role=admin_role if i % 20 == 0 else role,
+                email=f'query-plan-{i}@example.com',
+                username=f'query-plan-{i}',
+                first_name='Query',
+                last_name='Plan',
+                is_active=rng.random() > 0.05,
+            )
+            for i in range(max(post_count // 100, 10))
+        ], batch_size=batch_size)
+
+        tags = Tag.objects.bulk_create([
+            Tag(name=f'query-plan-tag-{i}', is_active=rng.random() > 0.05)
+            for i in range(max(post_count // 10, 100))
+        ], batch_size=batch_size)
+        categories = Category.objects.bulk_create([
+            Category(name=f'query-plan-category-{i}', is_active=rng.random() > 0.05)
+            for i in range(max(post_count // 25, 100))
+        ], batch_size=batch_size)
+
+        posts = BlogPost.objects.bulk_create([
+            BlogPost(
+                user=rng.choice(users),
+                category=rng.choice(categories),
+                title=f'Query plan post {i}',
+                content='Lorem ipsum ' * 50,
+                status=BlogPost.StatusChoice.PUBLISHED if rng.random() < 0.2 else BlogPost.StatusChoice.DRAFT,
+                is_featured=rng.random() < 0.01,
+                is_active=rng.random() > 0.05,
+            )
+            for i in range(post_count)
+        ], batch_size=batch_size)
+
+        Like.objects.bulk_create([
+            Like(user=users[i % len(users)], blog_post=posts[i // len(users)], is_active=rng.random() > 0.1)
+            for i in range(min(post_count, len(users) * len(posts)))
+        ], batch_size=batch_size)
+        Comment.objects.bulk_create([
+            Comment(user=rng.choice(users), blog_post=rng.choice(posts), content='Nice post',
+                    is_active=rng.random() > 0.05)
+            for _ in range(post_count)
+        ], batch_size=batch_size)
+        # One busy post, the comment listing matters most there
+        Comment.objects.bulk_create([
+            Comment(user=rng.choice(users), blog_post=posts[0], content='Nice post', is_active=rng.random() > 0.05)
+            for _ in range(post_count // 5)
+        ], batch_size=batch_size)
+        fill_root_paths(Comment.objects.all())
+
+        BlogPost.tags.through.objects.bulk_create([
+            BlogPost.tags.through(blogpost=post, tag=tag)
+            for post in posts
+            for tag in rng.sample(tags, 3)
+        ], batch_size=batch_size)
+
+        RelatedPost.objects.bulk_create([
+            RelatedPost(post=post, related=posts[(i + rank) % len(posts)], score=1 / rank, rank=rank)
+            for i, post in enumerate(posts)
+            for rank in range(1, 6)
+        ], batch_size=batch_size)
+
+        TrendingScore.objects.bulk_create([
+            TrendingScore(post=post, log_score=rng.gauss(0, 3), modified=post.modified) for post in posts
+        ], batch_size=batch_size)
+
+        with connection.cursor() as cursor:
+            for model in (get_user_model(), Tag, Category, BlogPost, BlogPost.tags.through, Like, Comment,
+                          RelatedPost, TrendingScore):
+                cursor.execute(f'ANALYZE {model._meta.db_table}')
+
+        return users[0].pk, posts[0].pk
+
+    def get_query_shapes(self, user_id, post_id):
+        """(name, queryset mirroring the view query, index name expected in the plan)"""
+
+        tag_ids = list(BlogPost.tags.through.objects.filter(blogpost_id=post_id).values_list('tag_id', flat=True)[:2])
+        public_posts = BlogPost.active_objects.filter(status=BlogPost.StatusChoice.PUBLISHED)
+        thread_path = Comment.objects.filter(blog_post_id=post_id).order_by('pk').values_list('path', flat=True)[0]
+        # Prefix of both indexes leading on tag_id, the planner prefers TAG_FILTER_INDEX over the FK index
+        # once vacuum has set the visibility map and index-only scans pay off
+        tag_through_index = f'{BlogPost.tags.through._meta.db_table}_tag_'
+
+        return [
+            (
+                'BlogListFilterAPIView',
+                BlogPost.active_objects.filter(user_id=user_id).order_by('-modified', '-id')[:5],
+                'blogpost_user_modified_idx',
+            ),
+            (
+                'BlogDetailAPIView.get_object',
+                BlogPost.active_objects.filter(pk=post_id)[:1],
+                'article_blogpost_pkey',
+            ),
+            (
+                'PublicBlogListAPIView',
+                BlogPost.active_objects.filter(status=BlogPost.StatusChoice.PUBLISHED)
+                .order_by('-modified', '-id')[:5],
+                'blogpost_status_modified_idx',
+            ),
+            (
+                'PublicBlogListAPIView tags (any)',
+                filter_by_tags(public_posts, tag_ids, TagFilterMode.ANY).order_by('-modified', '-id')[:5],
+                tag_through_index,
+            ),
+            (
+                'PublicBlogListAPIView tags (all)',
+                filter_by_tags(public_posts, tag_ids, TagFilterMode.ALL).order_by('-modified', '-id')[:5],
+                tag_through_index,
+            ),
+            (
+                'Featured posts',
+                BlogPost.active_objects.filter(is_featured=True).order_by('-modified')[:5],
+                'blogpost_featured_idx',
+            ),
+            (
+                'PublicRelatedBlogListAPIView',
+                RelatedPost.objects.filter(post_id=post_id).order_by('rank'),
+                'relatedpost_post_rank_uniq',
+            ),
+            (
+                'PublicTrendingBlogListAPIView',
+                TrendingScore.objects.filter(post__is_active=True, post__status=BlogPost.StatusChoice.PUBLISHED)
+                .order_by('-log_score')[:10],
+                'trendingscore_score_idx',
+            ),
+            (
+                'LikeCreateAPIView duplicate check',
+                Like.objects.filter(blog_post_id=post_id, user_id=user_id)[:1],
+                'like_like_user_id_blog_post_id',
+            ),
+            (
+                'Like counter rebuild',
+                Like.active_objects.filter(blog_post_id=post_id).values('pk'),
+                'like_post_active_idx',
+            ),
+            (
+                'Comment counter rebuild',
+                Comment.active_objects.filter(blog_post_id=post_id).values('pk'),
+                # Bitmap scan of the narrower foreign key index, the partial index serves the keyset pages
+                'comment_comment_blog_post_id_',
+            ),
+            (
+                'CommentListAPIView',
+                Comment.active_objects.filter(blog_post_id=post_id, created__gt=datetime(2000, 1, 1))
+                .select_related('user').order_by('created', 'id')[:10],
+                'comment_post_created_idx',
+            ),
+            (
+                'CommentThreadAPIView',
+                filter_subtree(Comment.active_objects.select_related('user'), thread_path)[:1000],
+                'comment_path_idx',
+            ),
+            (
+                'AdminListFilter',
+                get_user_model().active_objects.filter(role_id=GlobalValues.ADMIN.value).order_by('-id')[:5],
+                'user_role_active_idx',
+            ),
+            (
+                'Username uniqueness check',
+                get_user_model().active_objects.filter(username='query-plan-1')[:1],
+                'user_username_active_idx',
+            ),
+            (
+                'TagListFilterAPIView',
+                Tag.active_objects.order_by('-created', '-id')[:5],
+                'tag_created_idx',
+            ),
+            (
+                'Tag name uniqueness check',
+                Tag.active_objects.filter(name__iexact='query-plan-tag-1')[:1],
+                'tag_name_upper_idx',
+            ),
+            (
+                'CategoryListFilterAPIView',
+                Category.active_objects.only('pk', 'name', 'created').order_by('-created', '-id')[:5],
+                'category_created_idx',
+            ),
+            (
+                'Category name uniqueness check',
+                Category.active_objects.filter(name__iexact='query-plan-category-1')[:1],
+                'category_name_upper_idx',
+            ),
+        ]
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError("Query plan checks require PostgreSQL")
+
+        failures = []
+
+        with transaction.atomic():
+            user_id, post_id = self.seed(options['posts'])
+
+            for name, queryset, index_name in self.get_query_shapes(user_id, post_id):
+                plan = queryset.explain()
+
+                if index_name in plan:
+                    self.stdout.write(self.style.SUCCESS(f"OK    {name}: {index_name}"))
+                else:
+                    failures.append(name)
+                    self.stdout.write(self.style.ERROR(f"FAIL  {name}: expected {index_name}\n{plan}"))
+
+            # Never keep the sample data
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(f"{len(failures)} query shape(s) don't use their index: {', '.join(failures)}")
@@ -1,3 +1,18 @@
 from django.db import models
 
-# Create your models here.
+
+class ActiveQuerySet(models.QuerySet):
+    """QuerySet of a soft deletable model, rows with is_active=False are soft deleted"""
+
+    def active(self):
+        return self.filter(is_active=True)
+
+
+class ActiveManager(models.Manager.from_queryset(ActiveQuerySet)):
+    """
+        Live rows only, for every read that serves users.
+        Declared after `objects` so the default manager (admin, uniqueness checks, related lookups) still sees every row.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().active()
@@ -0,0 +1,31 @@
+class ExpandableFieldsMixin:
+    """
+        Serializer mixin: replace relation fields by nested serializers on request.
+        `expandable_fields` maps a field name to (serializer class, kwargs), the names to expand
+        are read from context['expand'].
+    """
+
+    expandable_fields = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        for field_name in self.context.get('expand', ()):
+            if field_name in self.expandable_fields and field_name in self.fields:
+                serializer_class, serializer_kwargs = self.expandable_fields[field_name]
+                self.fields[field_name] = serializer_class(read_only=True, **serializer_kwargs)
+
+
+class SparseFieldsMixin:
+    """
+        Serializer mixin: keep only the fields listed in context['fields'].
+        All fields are kept when the list is empty.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        requested = self.context.get('fields')
+        if requested:
+            for field_name in set(self.fields) - set(requested):
+                self.fields.pop(field_name)
@@ -0,0 +1,79 @@
+import hashlib
+import os
+
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.http.multipartparser import MultiPartParserError
+from django.utils.deconstruct import deconstructible
+
+
+class UploadTooLarge(MultiPartParserError):
+    """Raised while parsing, so DRF answers 400 instead of reading the rest of the body"""
+
+
+class HashingFileUploadHandler(TemporaryFileUploadHandler):
+    """
+        Stream every uploaded file to a temporary file chunk by chunk, enforcing FILE_UPLOAD_MAX_SIZE
+        as the bytes arrive and computing the sha256 of the content on the way.
+    """
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        # Reject before reading anything when the body can't fit one file plus the form fields
+        max_request_size = settings.FILE_UPLOAD_MAX_SIZE + settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+        if content_length and content_length > max_request_size:
+            raise UploadTooLarge(f"Request body exceeds {max_request_size} bytes")
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.hash = hashlib.sha256()
+        self.size = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.size += len(raw_data)
+        if self.size > settings.FILE_UPLOAD_MAX_SIZE:
+            raise UploadTooLarge(f"{self.file_name} exceeds {settings.FILE_UPLOAD_MAX_SIZE} bytes")
+
+        self.hash.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        uploaded_file = super().file_complete(file_size)
+        uploaded_file.sha256 = self.hash.hexdigest()
+        return uploaded_file
+
+
+def get_content_hash(content):
+    """sha256 of a file, reusing the digest computed while the upload was streamed"""
+
+    file = getattr(content, 'file', None)
+    digest = getattr(content, 'sha256', None) or getattr(file, 'sha256', None)
+    if digest:
+        return digest
+
+    content_hash = hashlib.sha256()
+    for chunk in content.chunks():
+        content_hash.update(chunk)
+    content.seek(0)
+    return content_hash.hexdigest()
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+        Store files under upload_to/<2 hex chars>/<sha256><extension>.
+        Saving content that already exists returns the existing name instead of writing a copy.
+    """
+
+    def save(self, name, content, max_length=None):
+        digest = get_content_hash(content)
+        directory, filename = os.path.split(name)
+        extension = os.path.splitext(filename)[1].lower()
+        name = os.path.join(directory, digest[:2], f'{digest}{extension}')
+
+        if self.exists(name):
+            return name
+        return super().save(name, content, max_length)
+
+
+content_addressed_storage = ContentAddressedStorage()
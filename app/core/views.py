@@ -1,5 +1,9 @@
+from django.core import signing
 from django.shortcuts import render
-from rest_framework.pagination import PageNumberPagination
+from drf_yasg import openapi
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, PageNumberPagination
+from rest_framework.utils.urls import replace_query_param
 
 
 # Create your views here.
@@ -11,6 +15,8 @@ class CustomPageNumberPagination(PageNumberPagination):
 
     # Set the name of the query param
     page_size_query_param = 'size'
+    # Larger sizes are clamped, a single request can't read a whole table
+    max_page_size = 100
 
     def paginate_queryset(self, queryset, request, view=None):
         """
@@ -24,4 +30,176 @@ class CustomPageNumberPagination(PageNumberPagination):
         paginator = self.django_paginator_class(queryset, self.page_size)
         self.page = paginator.get_page(page_number)
 
-        return self.page
\ No newline at end of file
+        return self.page
+
+
+class SignedCursorPagination(CursorPagination):
+    """
+        Keyset pagination: no COUNT(*) and no OFFSET scan, so every page costs the same.
+        The ordering is taken from the view's `cursor_ordering` and the cursor token is signed,
+        so clients can't forge positions.
+    """
+
+    page_size_query_param = 'size'
+    max_page_size = CustomPageNumberPagination.max_page_size
+    ordering = ('-created', '-id')
+    cursor_salt = 'app.core.views.SignedCursorPagination'
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, 'cursor_ordering', self.ordering)
+        if isinstance(ordering, str):
+            return (ordering,)
+        return tuple(ordering)
+
+    def encode_cursor(self, cursor):
+        tokens = {}
+        if cursor.offset != 0:
+            tokens['o'] = cursor.offset
+        if cursor.reverse:
+            tokens['r'] = 1
+        if cursor.position is not None:
+            tokens['p'] = cursor.position
+
+        encoded = signing.dumps(tokens, salt=self.cursor_salt, compress=True)
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+
+        try:
+            tokens = signing.loads(encoded, salt=self.cursor_salt)
+            offset = min(int(tokens.get('o', 0)), self.offset_cutoff)
+            reverse = bool(tokens.get('r', 0))
+            position = tokens.get('p')
+        except (signing.BadSignature, AttributeError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if offset < 0:
+            raise NotFound(self.invalid_cursor_message)
+
+        return Cursor(offset=offset, reverse=reverse, position=position)
+
+
+class CursorPaginationMixin:
+    """
+        Opt-in cursor pagination for list views.
+        `?pagination=cursor` (or following a `cursor` link) switches from page numbers to SignedCursorPagination.
+        Requests with any of `page_number_only_params` keep page numbers, for orderings a keyset can't follow.
+    """
+
+    cursor_pagination_class = SignedCursorPagination
+    cursor_ordering = ('-created', '-id')
+    page_number_only_params = ()
+
+    def use_cursor_pagination(self):
+        query_params = self.request.query_params
+        if any(param in query_params for param in self.page_number_only_params):
+            return False
+        return query_params.get('pagination') == 'cursor' or 'cursor' in query_params
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            if self.use_cursor_pagination():
+                self._paginator = self.cursor_pagination_class()
+            elif self.pagination_class is None:
+                self._paginator = None
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+
+class ExpandMixin:
+    """
+        View mixin for `?expand=a,b`: only relations listed in `expandable_relations` are accepted,
+        each mapped to 'select' (select_related) or 'prefetch' (prefetch_related), so a page of nested
+        objects costs a fixed number of queries.
+    """
+
+    expandable_relations = {}
+
+    def get_expand(self):
+        if not hasattr(self, '_expand'):
+            requested = self.request.query_params.get('expand', '')
+            self._expand = [
+                name for name in dict.fromkeys(part.strip() for part in requested.split(','))
+                if name in self.expandable_relations
+            ]
+        return self._expand
+
+    def apply_expand(self, queryset):
+        select_related = [name for name in self.get_expand() if self.expandable_relations[name] == 'select']
+        prefetch_related = [name for name in self.get_expand() if self.expandable_relations[name] == 'prefetch']
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+        return queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['expand'] = self.get_expand()
+        return context
+
+
+class SparseFieldsMixin:
+    """
+        View mixin for `?fields=a,b`: trims the serializer output and loads only the matching columns.
+        `sparse_fields` maps serializer field -> model field, tuple of model fields for computed fields,
+        or None for relations loaded separately.
+        `get_required_columns` returns columns that must always be loaded (ordering, select_related).
+    """
+
+    sparse_fields = {}
+
+    def get_sparse_fields(self):
+        if not hasattr(self, '_sparse_fields'):
+            requested = self.request.query_params.get('fields', '')
+            self._sparse_fields = [
+                name for name in dict.fromkeys(part.strip() for part in requested.split(','))
+                if name in self.sparse_fields
+            ]
+        return self._sparse_fields
+
+    def get_required_columns(self):
+        columns = ['pk']
+
+        cursor_ordering = getattr(self, 'cursor_ordering', ())
+        if isinstance(cursor_ordering, str):
+            cursor_ordering = (cursor_ordering,)
+        columns += [field.lstrip('-') for field in cursor_ordering]
+
+        # Relations joined with select_related can't be deferred
+        expandable_relations = getattr(self, 'expandable_relations', {})
+        if hasattr(self, 'get_expand'):
+            columns += [name for name in self.get_expand() if expandable_relations[name] == 'select']
+
+        return columns
+
+    def apply_sparse_fields(self, queryset):
+        fields = self.get_sparse_fields()
+        if not fields:
+            return queryset
+
+        columns = []
+        for name in fields:
+            column = self.sparse_fields[name]
+            if column:
+                columns += [column] if isinstance(column, str) else list(column)
+        return queryset.only(*dict.fromkeys(columns + self.get_required_columns()))
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['fields'] = self.get_sparse_fields()
+        return context
+
+
+cursor_pagination_parameters = [
+    openapi.Parameter('pagination', openapi.IN_QUERY, type=openapi.TYPE_STRING, enum=['cursor'],
+                      description='Use cursor pagination instead of page numbers'),
+    openapi.Parameter('cursor', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                      description='Cursor token from a previous next/previous link'),
+]
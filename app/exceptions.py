@@ -1,8 +1,9 @@
 from rest_framework import status
 from rest_framework.views import exception_handler
-from rest_framework.exceptions import Throttled, PermissionDenied, NotAuthenticated
+from rest_framework.exceptions import Throttled, PermissionDenied, NotAuthenticated, ParseError
 from django.conf import settings
 
+from app.core.uploads import UploadTooLarge
 from app.global_constants import ErrorMessage
 from app.utils import get_response_schema
 
@@ -28,4 +29,12 @@ def custom_exception_handler(exc, context):
             ErrorMessage.UNAUTHORIZED,
             NotAuthenticated.status_code
         )
+
+    # DRF wraps upload errors raised by the multipart parser in a ParseError
+    if isinstance(exc, ParseError) and isinstance(exc.__context__, UploadTooLarge):
+        return get_response_schema(
+            {settings.REST_FRAMEWORK['NON_FIELD_ERRORS_KEY']: [str(exc.__context__)]},
+            ErrorMessage.FILE_TOO_LARGE,
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        )
     return exception_handler(exc, context)
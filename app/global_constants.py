@@ -6,6 +6,7 @@ class SuccessMessage(str, Enum):
     RECORD_RETRIEVED = "Record retrieved successfully."
     RECORD_UPDATED = "Record updated successfully."
     RECORD_DELETED = "Record deleted successfully."
+    REQUEST_ACCEPTED = "Request accepted for processing."
 
     CREDENTIALS_MATCHED = "Login successful."
     CREDENTIALS_REMOVED = "Logout successful."
@@ -25,7 +26,8 @@ class ErrorMessage(str, Enum):
     THROTTLE_LIMIT_EXCEEDED = "Throttle Limit Exceeded"
 
     CATEGORY_NOT_FOUND = "Category not found"
-    POST_ALREADY_LIKE = "Post already liked"
+    BULK_LIMIT_EXCEEDED = "Too many items in one request"
+    FILE_TOO_LARGE = "Uploaded file is too large"
 
 class GlobalValues(int, Enum):
 
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from app.like.queue import apply_like_events
+
+
+class Command(BaseCommand):
+    help = "Apply the queued like/unlike events (LIKE_QUEUE_ENABLED) in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--follow', action='store_true', help="Keep polling the queue instead of exiting once empty")
+        parser.add_argument('--interval', type=float, default=1.0, help="Seconds between polls of an empty queue")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        total = 0
+
+        while True:
+            applied = apply_like_events(batch_size)
+            total += applied
+
+            if applied:
+                self.stdout.write(f"Applied {applied} like events")
+            elif options['follow']:
+                time.sleep(options['interval'])
+            else:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f"Applied {total} like events"))
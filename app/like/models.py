@@ -1,7 +1,10 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
 
 from app.article.models import BlogPost
+from app.core.models import ActiveManager, ActiveQuerySet
 
 
 # Create your models here.
@@ -27,5 +30,27 @@ class Like(models.Model):
     created = models.DateTimeField(auto_now_add=True)
     modified = models.DateTimeField(auto_now=True)
 
+    # Every row, soft deleted ones included; `active_objects` for live rows
+    objects = ActiveQuerySet.as_manager()
+    active_objects = ActiveManager()
+
     class Meta:
-        unique_together = ('user', 'blog_post')
\ No newline at end of file
+        unique_together = ('user', 'blog_post')
+        indexes = [
+            # Active likes of a post, used by the counter rebuild
+            models.Index(fields=['blog_post'], name='like_post_active_idx', condition=Q(is_active=True)),
+        ]
+
+
+class LikeEvent(models.Model):
+    """Like/unlike request waiting in the like queue, applied in batches by the process_like_events command"""
+
+    class ActionChoice(models.TextChoices):
+        LIKE = "like", _("Like")
+        UNLIKE = "unlike", _("Unlike")
+        TOGGLE = "toggle", _("Toggle")
+
+    user = models.ForeignKey(get_user_model(), on_delete=models.CASCADE, related_name='+')
+    blog_post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='+')
+    action = models.CharField(max_length=10, choices=ActionChoice)
+    created = models.DateTimeField(auto_now_add=True)
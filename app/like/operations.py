@@ -0,0 +1,132 @@
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+from app.article.counters import adjust_like_count
+from app.article.models import BlogPost
+from app.like.models import Like
+
+
+def _get_tables():
+    return Like._meta.db_table, BlogPost._meta.db_table
+
+
+def _like_postgresql(user_id, post_id):
+    like_table, post_table = _get_tables()
+    now = timezone.now()
+
+    # The upsert only returns a row when the like is new or revived, the counter follows in the same statement.
+    # xmax is 0 on a freshly inserted row version and set on one written by DO UPDATE
+    with connection.cursor() as cursor:
+        cursor.execute(f'''
+            WITH upsert AS (
+                INSERT INTO {like_table} (user_id, blog_post_id, is_active, created, modified)
+                VALUES (%s, %s, true, %s, %s)
+                ON CONFLICT (user_id, blog_post_id) DO UPDATE SET is_active = true, modified = EXCLUDED.modified
+                WHERE {like_table}.is_active = false
+                RETURNING blog_post_id, xmax = 0 AS inserted
+            ), counter AS (
+                UPDATE {post_table} SET like_count = like_count + 1 WHERE id IN (SELECT blog_post_id FROM upsert)
+            )
+            SELECT inserted FROM upsert
+        ''', [user_id, post_id, now, now])
+        row = cursor.fetchone()
+        return (True, row[0]) if row else (False, False)
+
+
+def _unlike_postgresql(user_id, post_id):
+    like_table, post_table = _get_tables()
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'''
+            WITH removed AS (
+                UPDATE {like_table} SET is_active = false, modified = %s
+                WHERE user_id = %s AND blog_post_id = %s AND is_active
+                RETURNING blog_post_id
+            ), counter AS (
+                UPDATE {post_table} SET like_count = like_count - 1 WHERE id IN (SELECT blog_post_id FROM removed)
+            )
+            SELECT count(*) FROM removed
+        ''', [timezone.now(), user_id, post_id])
+        return cursor.fetchone()[0] > 0
+
+
+def _toggle_postgresql(user_id, post_id):
+    like_table, post_table = _get_tables()
+    now = timezone.now()
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'''
+            WITH upsert AS (
+                INSERT INTO {like_table} (user_id, blog_post_id, is_active, created, modified)
+                VALUES (%s, %s, true, %s, %s)
+                ON CONFLICT (user_id, blog_post_id) DO UPDATE
+                SET is_active = NOT {like_table}.is_active, modified = EXCLUDED.modified
+                RETURNING blog_post_id, is_active, xmax = 0 AS inserted
+            ), counter AS (
+                UPDATE {post_table} SET like_count = like_count + CASE WHEN upsert.is_active THEN 1 ELSE -1 END
+                FROM upsert WHERE {post_table}.id = upsert.blog_post_id
+            )
+            SELECT is_active, inserted FROM upsert
+        ''', [user_id, post_id, now, now])
+        return cursor.fetchone()
+
+
+def _set_like_orm(user_id, post_id, active):
+    """
+        Portable version for the other databases: lock the row, then insert, revive or soft delete it.
+        Returns (changed, inserted) like _like_postgresql.
+    """
+
+    with transaction.atomic():
+        like = Like.objects.select_for_update().filter(user_id=user_id, blog_post_id=post_id).first()
+
+        if like is None:
+            if not active:
+                return False, False
+            try:
+                with transaction.atomic():
+                    Like.objects.create(user_id=user_id, blog_post_id=post_id)
+            except IntegrityError:
+                # A concurrent request inserted it first
+                if Like.objects.filter(user_id=user_id, blog_post_id=post_id).exists():
+                    return False, False
+                raise
+        elif like.is_active == active:
+            return False, False
+        else:
+            like.is_active = active
+            like.save(update_fields=['is_active', 'modified'])
+
+        adjust_like_count(post_id, 1 if active else -1)
+        return True, like is None
+
+
+def like_post(user_id, post_id):
+    """
+        Like the post, returns (changed, inserted): changed is False when the like was already active,
+        inserted is True only for the first like of the user on the post, not when a soft deleted one is revived
+    """
+
+    if connection.vendor == 'postgresql':
+        return _like_postgresql(user_id, post_id)
+    return _set_like_orm(user_id, post_id, True)
+
+
+def unlike_post(user_id, post_id):
+    """Soft delete the like, True when there was an active one"""
+
+    if connection.vendor == 'postgresql':
+        return _unlike_postgresql(user_id, post_id)
+    return _set_like_orm(user_id, post_id, False)[0]
+
+
+def toggle_like(user_id, post_id):
+    """Flip the like, returns (is_liked, inserted): whether the post is liked afterwards and whether the row is new"""
+
+    if connection.vendor == 'postgresql':
+        return _toggle_postgresql(user_id, post_id)
+
+    with transaction.atomic():
+        is_liked = Like.active_objects.filter(user_id=user_id, blog_post_id=post_id).exists()
+        _, inserted = _set_like_orm(user_id, post_id, not is_liked)
+        return not is_liked, inserted
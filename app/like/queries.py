@@ -0,0 +1,35 @@
+from django.db.models import Exists, OuterRef, Value
+
+from app.like.models import Like
+
+
+def annotate_liked_by_me(queryset, user):
+    """liked_by_me on every post of the queryset, one EXISTS probe of the (user, blog_post) unique index per row"""
+
+    if not user.is_authenticated:
+        return queryset.annotate(liked_by_me=Value(False))
+
+    return queryset.annotate(
+        liked_by_me=Exists(Like.active_objects.filter(user_id=user.id, blog_post_id=OuterRef('pk')))
+    )
+
+
+def set_liked_by_me(items, user):
+    """
+        Fill liked_by_me of already serialized posts, for payloads shared between users (cached feed pages).
+        One IN query for the whole page, none for anonymous readers.
+    """
+
+    items = [item for item in items if 'liked_by_me' in item and 'pk' in item]
+    if not items:
+        return
+
+    liked_post_ids = set()
+    if user.is_authenticated:
+        liked_post_ids = set(
+            Like.active_objects.filter(user_id=user.id, blog_post_id__in=[item['pk'] for item in items])
+            .values_list('blog_post_id', flat=True)
+        )
+
+    for item in items:
+        item['liked_by_me'] = item['pk'] in liked_post_ids
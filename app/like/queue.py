@@ -0,0 +1,133 @@
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+from app.article.counters import adjust_like_counts
+from app.article.trending import LIKE_WEIGHT, bump_trending
+from app.like.models import Like, LikeEvent
+
+
+def enqueue_like_event(user_id, post_id, action):
+    LikeEvent.objects.create(user_id=user_id, blog_post_id=post_id, action=action)
+
+
+def get_final_states(events, current_states):
+    """Fold queued events in order over the current like states, returns (user id, post id) -> liked"""
+
+    states = dict(current_states)
+    for event in events:
+        key = (event.user_id, event.blog_post_id)
+        if event.action == LikeEvent.ActionChoice.LIKE:
+            states[key] = True
+        elif event.action == LikeEvent.ActionChoice.UNLIKE:
+            states[key] = False
+        else:
+            states[key] = not states.get(key, False)
+    return states
+
+
+def _insert_likes_postgresql(pairs, now):
+    with connection.cursor() as cursor:
+        cursor.execute(f'''
+            INSERT INTO {Like._meta.db_table} (user_id, blog_post_id, is_active, created, modified)
+            SELECT user_id, blog_post_id, true, %s, %s FROM unnest(%s::bigint[], %s::bigint[]) AS t(user_id, blog_post_id)
+            ON CONFLICT (user_id, blog_post_id) DO NOTHING
+            RETURNING user_id, blog_post_id
+        ''', [now, now, [user_id for user_id, _ in pairs], [post_id for _, post_id in pairs]])
+        return [tuple(row) for row in cursor.fetchall()]
+
+
+def _insert_likes_orm(pairs):
+    try:
+        with transaction.atomic():
+            Like.objects.bulk_create([Like(user_id=user_id, blog_post_id=post_id) for user_id, post_id in pairs])
+        return list(pairs)
+    except IntegrityError:
+        pass
+
+    # A concurrent like inserted some of the pairs first, those are skipped one by one
+    inserted = []
+    for user_id, post_id in pairs:
+        try:
+            with transaction.atomic():
+                Like.objects.create(user_id=user_id, blog_post_id=post_id)
+            inserted.append((user_id, post_id))
+        except IntegrityError:
+            pass
+    return inserted
+
+
+def insert_likes(pairs, now):
+    """Insert active likes for the (user id, post id) pairs, returns the pairs actually inserted"""
+
+    if not pairs:
+        return []
+    if connection.vendor == 'postgresql':
+        return _insert_likes_postgresql(pairs, now)
+    return _insert_likes_orm(pairs)
+
+
+def apply_like_events(batch_size):
+    """
+        Apply the oldest `batch_size` queued events, returns how many were consumed.
+        Every (user, post) pair is written once whatever the number of its events, with one INSERT for the new likes,
+        one UPDATE per direction for existing rows and one counter UPDATE for all the posts of the batch.
+        Counter deltas come from the rows actually written, not from the planned changes.
+    """
+
+    with transaction.atomic():
+        # Concurrent workers take disjoint batches on PostgreSQL
+        events = list(LikeEvent.objects.select_for_update(skip_locked=True).order_by('pk')[:batch_size])
+        if not events:
+            return 0
+
+        # Read through the (user, blog_post) unique index, the few rows outside the event pairs are dropped.
+        # Locked so the like views can't flip them between this read and the writes below
+        pairs = {(event.user_id, event.blog_post_id) for event in events}
+        likes = Like.objects.select_for_update().filter(
+            user_id__in={user_id for user_id, _ in pairs},
+            blog_post_id__in={post_id for _, post_id in pairs}
+        ).order_by('pk').only('pk', 'user_id', 'blog_post_id', 'is_active')
+        likes = {(like.user_id, like.blog_post_id): like for like in likes}
+        likes = {pair: like for pair, like in likes.items() if pair in pairs}
+
+        current_states = {pair: like.is_active for pair, like in likes.items()}
+        final_states = get_final_states(events, current_states)
+
+        new_pairs, revived_likes, removed_likes = [], [], []
+        for (user_id, post_id), liked in final_states.items():
+            if liked == current_states.get((user_id, post_id), False):
+                continue
+
+            like = likes.get((user_id, post_id))
+            if like is None:
+                new_pairs.append((user_id, post_id))
+            elif liked:
+                revived_likes.append(like)
+            else:
+                removed_likes.append(like)
+
+        now = timezone.now()
+        # A pair inserted concurrently is already liked and was counted by its writer, so counters only
+        # follow the rows this batch actually wrote
+        inserted_pairs = insert_likes(new_pairs, now)
+        if revived_likes:
+            Like.objects.filter(pk__in=[like.pk for like in revived_likes]).update(is_active=True, modified=now)
+        if removed_likes:
+            Like.objects.filter(pk__in=[like.pk for like in removed_likes]).update(is_active=False, modified=now)
+
+        deltas, trending_weights = {}, {}
+        for _, post_id in inserted_pairs:
+            deltas[post_id] = deltas.get(post_id, 0) + 1
+            # Only first likes count towards trending, as in the like views
+            trending_weights[post_id] = trending_weights.get(post_id, 0) + LIKE_WEIGHT
+        for like in revived_likes:
+            deltas[like.blog_post_id] = deltas.get(like.blog_post_id, 0) + 1
+        for like in removed_likes:
+            deltas[like.blog_post_id] = deltas.get(like.blog_post_id, 0) - 1
+
+        adjust_like_counts(deltas)
+        bump_trending(trending_weights)
+
+        LikeEvent.objects.filter(pk__in=[event.pk for event in events]).delete()
+
+    return len(events)
@@ -1,9 +1,6 @@
 from rest_framework import serializers
 
-from app.like.models import Like
 
-
-class LikeCreateSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = Like
-        fields = ('blog_post', 'user')
\ No newline at end of file
+class LikeActionSerializer(serializers.Serializer):
+    # Existence is left to the foreign key, the like statement stays a single round trip
+    blog_post = serializers.IntegerField(min_value=1)
@@ -1,10 +1,11 @@
 from django.urls import path
 
-from app.like.views import LikeCreateAPIView
-from app.tag.views import TagCreateAPIView, TagDetailAPIView, TagListFilterAPIView
+from app.like.views import LikeCreateAPIView, LikeDetailAPIView, LikeToggleAPIView
 
 urlpatterns = [
 
     path("", LikeCreateAPIView.as_view(),name="like-create"),
+    path('<int:blog_post>', LikeDetailAPIView.as_view(), name='like-detail'),
+    path('toggle/', LikeToggleAPIView.as_view(), name='like-toggle'),
 
 ]
@@ -1,51 +1,145 @@
 from django.conf import settings
+from django.db import IntegrityError, transaction
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
 from rest_framework.generics import GenericAPIView
+from rest_framework.relations import PrimaryKeyRelatedField
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from app.article.trending import LIKE_WEIGHT, bump_trending
 from app.global_constants import SuccessMessage, ErrorMessage
-from app.like.models import Like
-from app.like.serializers import LikeCreateSerializer
+from app.like.models import LikeEvent
+from app.like.operations import like_post, toggle_like, unlike_post
+from app.like.queue import enqueue_like_event
+from app.like.serializers import LikeActionSerializer
 from app.utils import get_response_schema
 from permissions import IsUser
 
+like_request_body = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        'blog_post': openapi.Schema(type=openapi.TYPE_INTEGER, description='Post ID'),
+    }
+)
+
+
+def get_like_data(request, post_id, is_liked):
+    return {'blog_post': post_id, 'user': request.user.id, 'is_liked': is_liked}
+
+
+def get_missing_post_response(post_id):
+    # Raised by the deferred foreign key check when the transaction commits
+    return get_response_schema(
+        {'blog_post': [PrimaryKeyRelatedField.default_error_messages['does_not_exist'].format(pk_value=post_id)]},
+        ErrorMessage.BAD_REQUEST.value,
+        status.HTTP_400_BAD_REQUEST
+    )
+
+
+def get_queued_response(request, post_id, action, is_liked):
+    """Queue the event for process_like_events and answer 202, is_liked is None when it depends on the queue"""
+
+    try:
+        with transaction.atomic():
+            enqueue_like_event(request.user.id, post_id, action)
+    except IntegrityError:
+        return get_missing_post_response(post_id)
+
+    return get_response_schema(
+        get_like_data(request, post_id, is_liked),
+        SuccessMessage.REQUEST_ACCEPTED.value,
+        status.HTTP_202_ACCEPTED
+    )
+
 
 # Create your views here.
 class LikeCreateAPIView(GenericAPIView):
+    """View: Like a post, liking it again is a no-op"""
+
     permission_classes = [IsUser]
     authentication_classes = [JWTAuthentication]
 
-    @swagger_auto_schema(
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            properties={
-                'blog_post': openapi.Schema(type=openapi.TYPE_INTEGER, description='Post ID'),
-            }
-        )
-    )
+    @swagger_auto_schema(request_body=like_request_body)
     def post(self, request):
-        request.data['user'] = request.user.id
-
-        # Check if the like already exists
-        like_queryset = Like.objects.filter(blog_post_id=request.data['blog_post'], user_id=request.user.id).exists()
 
-        if like_queryset:
-            return get_response_schema(
-                {settings.REST_FRAMEWORK['NON_FIELD_ERRORS_KEY']: [ErrorMessage.POST_ALREADY_LIKE.value]},
-                ErrorMessage.BAD_REQUEST.value,
-                status.HTTP_400_BAD_REQUEST
-            )
+        serializer = LikeActionSerializer(data=request.data)
+        if not serializer.is_valid():
+            return get_response_schema(serializer.errors, ErrorMessage.BAD_REQUEST.value, status.HTTP_400_BAD_REQUEST)
 
+        post_id = serializer.validated_data['blog_post']
+        if settings.LIKE_QUEUE_ENABLED:
+            return get_queued_response(request, post_id, LikeEvent.ActionChoice.LIKE, True)
 
+        try:
+            with transaction.atomic():
+                created, inserted = like_post(request.user.id, post_id)
+                # Scores can't decrease, so unlike/like cycles mustn't add up: only a first like counts
+                if inserted:
+                    bump_trending({post_id: LIKE_WEIGHT})
+        except IntegrityError:
+            return get_missing_post_response(post_id)
 
-        serializer = LikeCreateSerializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save()
+        if created:
             return get_response_schema(
-                serializer.data,
+                get_like_data(request, post_id, True),
                 SuccessMessage.RECORD_CREATED.value,
                 status.HTTP_201_CREATED
             )
-        return get_response_schema(serializer.errors, ErrorMessage.BAD_REQUEST.value, status.HTTP_400_BAD_REQUEST)
+        return get_response_schema(
+            get_like_data(request, post_id, True),
+            SuccessMessage.RECORD_RETRIEVED.value,
+            status.HTTP_200_OK
+        )
+
+
+class LikeDetailAPIView(GenericAPIView):
+    """View: Unlike a post, unliking a post that isn't liked is a no-op"""
+
+    permission_classes = [IsUser]
+    authentication_classes = [JWTAuthentication]
+
+    def delete(self, request, blog_post):
+
+        if settings.LIKE_QUEUE_ENABLED:
+            return get_queued_response(request, blog_post, LikeEvent.ActionChoice.UNLIKE, False)
+
+        unlike_post(request.user.id, blog_post)
+
+        return get_response_schema(
+            get_like_data(request, blog_post, False),
+            SuccessMessage.RECORD_DELETED.value,
+            status.HTTP_200_OK
+        )
+
+
+class LikeToggleAPIView(GenericAPIView):
+    """View: Like the post if it isn't liked, unlike it otherwise"""
+
+    permission_classes = [IsUser]
+    authentication_classes = [JWTAuthentication]
+
+    @swagger_auto_schema(request_body=like_request_body)
+    def post(self, request):
+
+        serializer = LikeActionSerializer(data=request.data)
+        if not serializer.is_valid():
+            return get_response_schema(serializer.errors, ErrorMessage.BAD_REQUEST.value, status.HTTP_400_BAD_REQUEST)
+
+        post_id = serializer.validated_data['blog_post']
+        if settings.LIKE_QUEUE_ENABLED:
+            return get_queued_response(request, post_id, LikeEvent.ActionChoice.TOGGLE, None)
+
+        try:
+            with transaction.atomic():
+                is_liked, inserted = toggle_like(request.user.id, post_id)
+                if inserted:
+                    bump_trending({post_id: LIKE_WEIGHT})
+        except IntegrityError:
+            return get_missing_post_response(post_id)
+
+        return get_response_schema(
+            get_like_data(request, post_id, is_liked),
+            SuccessMessage.RECORD_UPDATED.value,
+            status.HTTP_200_OK
+        )
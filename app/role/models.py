@@ -1,6 +1,8 @@
 # Package imports
 from django.db import models
 
+from app.core.models import ActiveManager, ActiveQuerySet
+
 
 class Role(models.Model):
     """ Model: Role """
@@ -12,3 +14,7 @@ class Role(models.Model):
     is_active = models.BooleanField(default=True)
     created = models.DateTimeField(auto_now_add=True)
     modified = models.DateTimeField(auto_now=True)
+
+    # Every row, soft deleted ones included; `active_objects` for live rows
+    objects = ActiveQuerySet.as_manager()
+    active_objects = ActiveManager()
@@ -144,6 +144,15 @@ USE_TZ = False
 
 STATIC_URL = 'static/'
 
+# Uploaded files
+MEDIA_URL = 'media/'
+MEDIA_ROOT = os.getenv('MEDIA_ROOT', BASE_DIR / 'media')
+
+# Uploads are streamed to a temporary file and hashed chunk by chunk, never buffered in memory
+FILE_UPLOAD_HANDLERS = ['app.core.uploads.HashingFileUploadHandler']
+# Max size of one uploaded file in bytes, checked while the upload is received
+FILE_UPLOAD_MAX_SIZE = int(os.getenv('FILE_UPLOAD_MAX_SIZE', 5 * 1024 * 1024))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -171,6 +180,43 @@ REST_FRAMEWORK = {
     'EXCEPTION_HANDLER': "app.exceptions.custom_exception_handler"
 }
 
+# Cache (set CACHE_BACKEND/CACHE_LOCATION to a shared cache such as Redis or Memcached in production)
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+}
+
+# Seconds a public feed page or post stays cached, changes invalidate it earlier
+PUBLIC_FEED_CACHE_TIMEOUT = int(os.getenv('PUBLIC_FEED_CACHE_TIMEOUT', 300))
+
+# Buffered view counting: seconds between flushes and max number of posts held in memory
+VIEW_COUNT_FLUSH_INTERVAL = int(os.getenv('VIEW_COUNT_FLUSH_INTERVAL', 10))
+VIEW_COUNT_BUFFER_SIZE = int(os.getenv('VIEW_COUNT_BUFFER_SIZE', 1000))
+
+# Server-side Markdown rendering of post bodies and the number of renderings kept per process
+RENDER_CONTENT = os.getenv('RENDER_CONTENT', 'True') == 'True'
+RENDERED_CONTENT_CACHE_SIZE = int(os.getenv('RENDERED_CONTENT_CACHE_SIZE', 512))
+
+# Number of related posts precomputed per post
+RELATED_POSTS_LIMIT = int(os.getenv('RELATED_POSTS_LIMIT', 10))
+
+# Hours after which a like or view counts half as much in the trending ranking
+TRENDING_HALF_LIFE_HOURS = int(os.getenv('TRENDING_HALF_LIFE_HOURS', 24))
+
+# Threads building the resized variants of uploaded images
+IMAGE_VARIANT_WORKERS = int(os.getenv('IMAGE_VARIANT_WORKERS', 2))
+
+# Rows fetched per round trip (and per tag prefetch) when streaming a post export
+EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', 2000))
+
+# Max number of posts accepted by one bulk create/update request
+BLOG_BULK_MAX_ITEMS = int(os.getenv('BLOG_BULK_MAX_ITEMS', 1000))
+
+# Accept likes into the LikeEvent queue with a 202, applied in batches by `manage.py process_like_events`
+LIKE_QUEUE_ENABLED = os.getenv('LIKE_QUEUE_ENABLED', 'False') == 'True'
+
 # Custom user model
 AUTH_USER_MODEL = 'user.User'
 
@@ -1,4 +1,8 @@
 from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Upper
+
+from app.core.models import ActiveManager, ActiveQuerySet
 
 # Create your models here.
 class Tag(models.Model):
@@ -9,4 +13,16 @@ class Tag(models.Model):
     # Additional field declarations
     is_active = models.BooleanField(default=True)
     created = models.DateTimeField(auto_now_add=True)
-    modified = models.DateTimeField(auto_now=True)
\ No newline at end of file
+    modified = models.DateTimeField(auto_now=True)
+
+    # Every row, soft deleted ones included; `active_objects` for live rows
+    objects = ActiveQuerySet.as_manager()
+    active_objects = ActiveManager()
+
+    class Meta:
+        indexes = [
+            # TagListFilterAPIView ordering, keyset pages on (-created, -id)
+            models.Index(fields=['-created', '-id'], name='tag_created_idx', condition=Q(is_active=True)),
+            # Case insensitive uniqueness checks (name__iexact) in the serializers
+            models.Index(Upper('name'), name='tag_name_upper_idx', condition=Q(is_active=True)),
+        ]
@@ -11,7 +11,7 @@ class TagCreateSerializer(serializers.ModelSerializer):
     def validate_name(self, value):
         name = value.strip()
 
-        if Tag.objects.filter(name__iexact=name, is_active=True).exists():
+        if Tag.active_objects.filter(name__iexact=name).exists():
             raise serializers.ValidationError("Tag already in use")
 
         return name.capitalize()
@@ -30,7 +30,7 @@ class TagUpdateSerializer(serializers.ModelSerializer):
     def validate_name(self, value):
         name = value.strip()
 
-        if Tag.objects.filter(name__iexact=name, is_active=True).exclude(pk=self.instance.pk).exists():
+        if Tag.active_objects.filter(name__iexact=name).exclude(pk=self.instance.pk).exists():
             raise serializers.ValidationError("Tag already in use")
 
         return name.capitalize()
\ No newline at end of file
@@ -5,11 +5,11 @@ from rest_framework import status
 from rest_framework.generics import GenericAPIView, ListAPIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
-from app.core.views import CustomPageNumberPagination
+from app.core.views import CustomPageNumberPagination, CursorPaginationMixin, cursor_pagination_parameters
 from app.global_constants import SuccessMessage, ErrorMessage
 from app.tag.models import Tag
 from app.tag.serializers import TagCreateSerializer, TagDisplaySerializer, TagUpdateSerializer
-from app.utils import get_response_schema
+from app.utils import get_response_schema, get_record_validators, get_not_modified_response, set_validator_headers
 from permissions import IsAdmin
 
 
@@ -47,18 +47,32 @@ class TagDetailAPIView(GenericAPIView):
 
     def get_object(self, pk):
 
-        tag_queryset = Tag.objects.filter(pk=pk, is_active=True)
+        tag_queryset = Tag.active_objects.filter(pk=pk)
 
         if tag_queryset.exists():
             return tag_queryset.first()
 
         return None
 
+    def get_version(self, pk):
+        """Cheap probe of the modified timestamp before loading the row"""
+
+        return Tag.active_objects.filter(pk=pk).values('modified').first()
+
     def get(self, request, pk):
 
         if not pk:
             return get_response_schema({}, ErrorMessage.BAD_REQUEST.value, status.HTTP_400_BAD_REQUEST)
 
+        version = self.get_version(pk)
+
+        if not version:
+            return get_response_schema({}, ErrorMessage.NOT_FOUND.value, status.HTTP_404_NOT_FOUND)
+
+        etag, last_modified = get_record_validators(version['modified'], pk)
+        not_modified_response = get_not_modified_response(request, etag, last_modified)
+        if not_modified_response:
+            return not_modified_response
 
         tag = self.get_object(pk)
 
@@ -67,7 +81,8 @@ class TagDetailAPIView(GenericAPIView):
 
         serializer = TagDisplaySerializer(tag)
 
-        return get_response_schema(serializer.data, SuccessMessage.RECORD_RETRIEVED.value, status.HTTP_200_OK)
+        response = get_response_schema(serializer.data, SuccessMessage.RECORD_RETRIEVED.value, status.HTTP_200_OK)
+        return set_validator_headers(response, etag, last_modified)
 
 
     @swagger_auto_schema(
@@ -113,18 +128,19 @@ class TagDetailAPIView(GenericAPIView):
         return get_response_schema({}, SuccessMessage.RECORD_DELETED.value, status.HTTP_204_NO_CONTENT)
 
 
-class TagListFilterAPIView(ListAPIView):
+class TagListFilterAPIView(CursorPaginationMixin, ListAPIView):
     """View: List Filter ag(Only Admin)"""
 
     serializer_class = TagDisplaySerializer
     pagination_class = CustomPageNumberPagination
+    cursor_ordering = ('-created', '-id')
 
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAdmin]
 
     def get_queryset(self):
 
-        queryset = Tag.objects.filter(is_active=True).order_by('-created')
+        queryset = Tag.active_objects.order_by('-created')
 
         # Filter by name
         name = self.request.query_params.get('name')
@@ -135,7 +151,8 @@ class TagListFilterAPIView(ListAPIView):
 
     @swagger_auto_schema(
         manual_parameters=[
-            openapi.Parameter('name', openapi.IN_QUERY, type=openapi.TYPE_STRING,)
+            openapi.Parameter('name', openapi.IN_QUERY, type=openapi.TYPE_STRING,),
+            *cursor_pagination_parameters,
         ]
     )
     def get(self, request, *args, **kwargs):
@@ -16,6 +16,7 @@ Including another URLconf
 """
 import debug_toolbar
 from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 # swagger imports
@@ -53,4 +54,6 @@ if settings.DEBUG:
     urlpatterns += [path('silk/', include('silk.urls', namespace='silk'))]
     # Documentation
     urlpatterns += [path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui')]
+    # Uploaded media
+    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
@@ -2,11 +2,14 @@ from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.models import PermissionsMixin
 from django.core.validators import FileExtensionValidator
 from django.db import models
+from django.db.models import Q
 
+from app.core.models import ActiveManager, ActiveQuerySet
+from app.core.uploads import content_addressed_storage
 from app.role.models import Role
 
 
-class UserManager(BaseUserManager):
+class UserManager(BaseUserManager.from_queryset(ActiveQuerySet)):
     """ Manager: User model """
 
     def create_user(self, email, password, **extra_fields):
@@ -45,10 +48,13 @@ class User(AbstractBaseUser, PermissionsMixin):
     # Profile picture
     profile_picture = models.ImageField(
         upload_to='profile_pictures/',
+        storage=content_addressed_storage,
         blank=True,
         null=True,
         validators=[FileExtensionValidator(allowed_extensions=['jpg', 'jpeg', 'png', 'gif'])]
     )
+    # Urls of the resized copies of `profile_picture`, built off-request by app.core.images
+    profile_picture_variants = models.JSONField(default=dict, blank=True, editable=False)
 
     # Account settings
     is_private = models.BooleanField(default=False)
@@ -63,15 +69,17 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username', 'first_name', 'last_name']
 
-    # Use custom manager
+    # Use custom manager, every row; `active_objects` for live users
     objects = UserManager()
+    active_objects = ActiveManager()
 
     class Meta:
         indexes = [
-            models.Index(fields=['email']),
-            models.Index(fields=['username']),
+            # Username uniqueness checks of the serializers
+            models.Index(fields=['username'], name='user_username_active_idx', condition=Q(is_active=True)),
             models.Index(fields=['created']),
-            models.Index(fields=['role']),
+            # Admin listing: AdminListFilterAPIView, keyset pages on -id
+            models.Index(fields=['role', '-id'], name='user_role_active_idx', condition=Q(is_active=True)),
         ]
         constraints = [
             models.UniqueConstraint(fields=['email', 'username'], name='unique_email_username')
@@ -30,13 +30,13 @@ class UserCreateSerializer(serializers.ModelSerializer):
     def validate_email(self, value):
         # Custom email validation logic
         email = value.strip()
-        if get_user_model().objects.filter(email=email,is_active=True).exists():
+        if get_user_model().active_objects.filter(email=email).exists():
             raise serializers.ValidationError("Email already in use")
         return email
 
     def validate_username(self, value):
         username = value.strip()
-        if get_user_model().objects.filter(username=username,is_active=True).exists():
+        if get_user_model().active_objects.filter(username=username).exists():
             raise serializers.ValidationError("Username already in use")
         return username
 
@@ -72,6 +72,7 @@ class UserDisplaySerializer(serializers.ModelSerializer):
             'location',
             'website',
             'profile_picture',
+            'profile_picture_variants',
             'is_private',
             'is_verified',
             'is_active',
@@ -94,8 +95,24 @@ class UserListFilterDisplaySerializer(serializers.ModelSerializer):
             'location',
             'website',
             'profile_picture',
+            'profile_picture_variants',
         )
 
+class UserAuthorDisplaySerializer(serializers.ModelSerializer):
+    """ Serializer: Public author details nested in blog posts """
+
+    class Meta:
+        model = get_user_model()
+        fields = (
+            'pk',
+            'username',
+            'first_name',
+            'last_name',
+            'profile_picture',
+            'profile_picture_variants',
+        )
+
+
 class UserUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = get_user_model()
@@ -118,13 +135,13 @@ class UserUpdateSerializer(serializers.ModelSerializer):
     def validate_email(self, value):
         # Custom email validation logic
         email = value.strip()
-        if get_user_model().objects.filter(email=email,is_active=True).exclude(pk=self.instance.pk).exists():
+        if get_user_model().active_objects.filter(email=email).exclude(pk=self.instance.pk).exists():
             raise serializers.ValidationError("Email already in use")
         return email
 
     def validate_username(self, value):
         username = value.strip()
-        if get_user_model().objects.filter(username=username,is_active=True).exclude(pk=self.instance.pk).exists():
+        if get_user_model().active_objects.filter(username=username).exclude(pk=self.instance.pk).exists():
             raise serializers.ValidationError("Username already in use")
         return username
 
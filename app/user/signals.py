@@ -0,0 +1,17 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from app.core.images import reset_stale_variants, schedule_image_variants
+
+
+@receiver(pre_save, sender=get_user_model())
+def user_saving(sender, instance, **kwargs):
+    reset_stale_variants(instance, 'profile_picture', 'profile_picture_variants')
+
+
+@receiver(post_save, sender=get_user_model())
+def user_saved(sender, instance, **kwargs):
+    """Build the resized profile pictures once the upload is committed"""
+
+    schedule_image_variants(instance, 'profile_picture', 'profile_picture_variants', 'updated')
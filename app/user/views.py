@@ -13,11 +13,11 @@ from rest_framework.throttling import AnonRateThrottle
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from app.core.views import CustomPageNumberPagination
+from app.core.views import CustomPageNumberPagination, CursorPaginationMixin, cursor_pagination_parameters
 from app.global_constants import SuccessMessage, ErrorMessage, GlobalValues
 from app.user.serializers import UserDisplaySerializer, UserCreateSerializer, UserListFilterDisplaySerializer, \
     UserUpdateSerializer
-from app.utils import get_response_schema
+from app.utils import get_response_schema, get_record_validators, get_not_modified_response, set_validator_headers
 from permissions import IsSuperAdmin
 
 logger = logging.getLogger('django')
@@ -142,7 +142,7 @@ class UserLogin(GenericAPIView):
                     status.HTTP_400_BAD_REQUEST
                 )
 
-            user = get_user_model().objects.filter(email=email, is_active=True).first()
+            user = get_user_model().active_objects.filter(email=email).first()
 
             if user is None:
                 logger.warning(f"Login attempt for non-existent email: {email}")
@@ -264,11 +264,12 @@ class AdminSetupView(GenericAPIView):
             )
 
 
-class AdminListFilter(ListAPIView):
+class AdminListFilter(CursorPaginationMixin, ListAPIView):
     """View: Admin List Filter"""
 
     serializer_class = UserListFilterDisplaySerializer
     pagination_class = CustomPageNumberPagination
+    cursor_ordering = ('-id',)
 
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsSuperAdmin]
@@ -278,12 +279,11 @@ class AdminListFilter(ListAPIView):
         query_params = self.request.query_params
 
         # Only fetch necessary fields to optimize performance
-        queryset = get_user_model().objects.filter(
-            is_active=True,
+        queryset = get_user_model().active_objects.filter(
             role_id=GlobalValues.ADMIN.value
         ).only(
             'email', 'first_name', 'last_name', 'username', 'bio',
-            'birth_date', 'location', 'website', 'profile_picture'
+            'birth_date', 'location', 'website', 'profile_picture', 'profile_picture_variants'
         ).order_by('-id')
 
         # Extract filters
@@ -321,6 +321,7 @@ class AdminListFilter(ListAPIView):
             openapi.Parameter('location', openapi.IN_QUERY, type=openapi.TYPE_STRING, description='Filter by location'),
             openapi.Parameter('birth_date', openapi.IN_QUERY, type=openapi.TYPE_STRING, format=openapi.FORMAT_DATE,
                               description='Filter by birth date'),
+            *cursor_pagination_parameters,
         ]
     )
     def get(self, request, *args, **kwargs):
@@ -333,11 +334,19 @@ class UserDetailAPI(GenericAPIView):
 
     def get_object(self, pk):
 
-        user_queryset = get_user_model().objects.select_related('role').filter(pk=pk,is_active=True, role_id=GlobalValues.ADMIN.value)
+        user_queryset = get_user_model().active_objects.select_related('role').filter(pk=pk, role_id=GlobalValues.ADMIN.value)
         if user_queryset:
             return user_queryset[0]
         return None
 
+    def get_version(self, pk):
+        """Cheap probe of the updated timestamp before loading the row"""
+
+        return get_user_model().active_objects.filter(
+            pk=pk,
+            role_id=GlobalValues.ADMIN.value
+        ).values('updated').first()
+
     def get(self, request, pk):
         logger.info(f"UserDetailAPI accessed by user: {request.user}. Requested user ID: {pk}")
 
@@ -345,6 +354,21 @@ class UserDetailAPI(GenericAPIView):
             logger.warning("Bad request: No primary key provided.")
             return get_response_schema({}, ErrorMessage.BAD_REQUEST.value, status.HTTP_400_BAD_REQUEST)
 
+        version = self.get_version(pk)
+        if not version:
+            logger.error(f"Error retrieving user with ID {pk}", exc_info=True)
+            return get_response_schema(
+                {},
+                ErrorMessage.NOT_FOUND.value,
+                status.HTTP_404_NOT_FOUND
+            )
+
+        etag, last_modified = get_record_validators(version['updated'], pk)
+        not_modified_response = get_not_modified_response(request, etag, last_modified)
+        if not_modified_response:
+            logger.info(f"User with ID {pk} not modified")
+            return not_modified_response
+
         user = self.get_object(pk)
         if not user:
             logger.error(f"Error retrieving user with ID {pk}", exc_info=True)
@@ -356,11 +380,12 @@ class UserDetailAPI(GenericAPIView):
 
         serializer = UserDisplaySerializer(user)
         logger.info(f"Successfully retrieved user with ID {pk}")
-        return get_response_schema(
+        response = get_response_schema(
             serializer.data,
             SuccessMessage.RECORD_RETRIEVED.value,
             status.HTTP_200_OK
         )
+        return set_validator_headers(response, etag, last_modified)
 
 
     def delete(self, request, pk):
@@ -1,3 +1,7 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from rest_framework.response import Response
 
 
@@ -14,3 +18,29 @@ def get_response_schema(schema, message, status_code):
     )
 
 
+def get_record_validators(modified, *version_parts):
+    """Utility: ETag and Last-Modified timestamp for one version of a record"""
+
+    last_modified = int(modified.timestamp())
+    version = ':'.join(str(part) for part in (modified.isoformat(), *version_parts))
+    etag = '"%s"' % hashlib.md5(version.encode('utf-8')).hexdigest()
+
+    return etag, last_modified
+
+
+def get_not_modified_response(request, etag, last_modified):
+    """Utility: 304 response when If-None-Match / If-Modified-Since match, otherwise None"""
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        set_validator_headers(response, etag, last_modified)
+    return response
+
+
+def set_validator_headers(response, etag, last_modified):
+    """Utility: Attach ETag and Last-Modified (when given) so clients can revalidate with a conditional GET"""
+
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    return response